@@ -6,90 +6,205 @@ This example demonstrates chat completions with context management.
 """
 
 import asyncio
+import hashlib
+import json
 import os
 from dataclasses import dataclass, field
-from typing import Literal, Callable, Optional
+from typing import Literal, Callable, Optional, TypedDict
 
 from luna import LunaClient
 
-
-client = LunaClient(api_key=os.environ["LUNA_API_KEY"])
-
 Role = Literal["system", "user", "assistant"]
 
 
-@dataclass
-class ChatMessage:
-    """A chat message."""
+class ChatMessage(TypedDict):
+    """A chat message, in the shape the AI API expects."""
     role: Role
     content: str
 
 
+class ResponseCache:
+    """Response cache in front of ``client.ai.chat_completions``.
+
+    A query is answered from the cache when the same question was already
+    asked with the same model, temperature and conversation context.
+    """
+
+    def __init__(self, client: LunaClient):
+        self._client = client
+        self._responses: dict[tuple[str, str], object] = {}
+
+    @staticmethod
+    def _split(messages: list[dict]) -> tuple[str, list[dict]]:
+        """Separate the latest user query from the rest of the context."""
+        index = max(i for i, msg in enumerate(messages) if msg["role"] == "user")
+        return messages[index]["content"], messages[:index] + messages[index + 1:]
+
+    @staticmethod
+    def _context_key(model: str, temperature: float, context: list[dict]) -> str:
+        canonical = json.dumps(
+            [model, temperature, context], sort_keys=True, separators=(",", ":")
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    async def chat_completions(self, model: str, messages: list[dict], temperature: float):
+        """Return a cached response for the query, calling the API on a miss."""
+        query, context = self._split(messages)
+        key = (query, self._context_key(model, temperature, context))
+
+        response = self._responses.get(key)
+        if response is None:
+            response = await self._client.ai.chat_completions(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+            )
+            self._responses[key] = response
+        return response
+
+
 @dataclass
 class LunaChatbot:
     """A chatbot powered by Luna's AI API."""
     
+    client: LunaClient
     model: str = "luna-gpt-4"
     temperature: float = 0.7
     system_prompt: str = "You are a helpful assistant powered by Luna SDK. Be concise and helpful."
+    # Stored in API wire format so each turn is an O(1) append rather than
+    # an O(N) rebuild of the whole transcript.
     conversation_history: list[ChatMessage] = field(default_factory=list)
+    # Number of user/assistant exchanges kept verbatim; older ones are
+    # folded into ``summary`` so prompt size stays bounded.
+    max_turns: int = 20
+    summary: str = ""
+    # Optional response cache; repeated questions in the same context are
+    # then answered without an API call.
+    cache: Optional[ResponseCache] = None
 
     def __post_init__(self):
         """Initialize with system prompt."""
-        self.conversation_history.append(
-            ChatMessage(role="system", content=self.system_prompt)
-        )
-
-    async def chat(self, user_message: str) -> str:
-        """Send a message and get a response."""
-        # Add user message to history
-        self.conversation_history.append(
-            ChatMessage(role="user", content=user_message)
-        )
-
-        # Build messages for API
-        messages = [
-            {"role": msg.role, "content": msg.content}
-            for msg in self.conversation_history
-        ]
+        # The system prompt is the static prefix of every request, which lets
+        # the provider's prompt cache hit across turns. It is never edited;
+        # per-turn context goes into a trailing message instead.
+        self._static_prefix = ({"role": "system", "content": self.system_prompt},)
+        self.conversation_history[:0] = self._static_prefix
+        if self.summary:
+            self.conversation_history.insert(1, self._summary_message())
+        self._summary_task: Optional[asyncio.Task] = None
+
+    async def _start_turn(self, user_message: str, context: Optional[str]) -> list[ChatMessage]:
+        """Record the user message and return the messages to send."""
+        # Make sure evicted turns from the last exchange have been summarized
+        if self._summary_task is not None:
+            try:
+                await self._summary_task
+            except Exception as e:
+                print(f"Warning: could not summarize earlier conversation: {e}")
+            self._summary_task = None
+
+        # Append only the new turn; earlier entries are never mutated
+        self.conversation_history.append({"role": "user", "content": user_message})
+        if context:
+            return [*self.conversation_history, {"role": "system", "content": context}]
+        return self.conversation_history
+
+    async def chat(self, user_message: str, context: Optional[str] = None) -> str:
+        """Send a message and get a response.
+
+        ``context`` (e.g. retrieved memories) is sent as a trailing system
+        message for this turn only, keeping the cached prefix intact.
+        """
+        messages = await self._start_turn(user_message, context)
 
         # Call the AI API
-        response = await client.ai.chat_completions(
+        complete = self.cache.chat_completions if self.cache else self.client.ai.chat_completions
+        response = await complete(
             model=self.model,
             messages=messages,
             temperature=self.temperature,
         )
 
         # Extract assistant response
-        assistant_message = response.choices[0].message.content
+        assistant_message = response.text
 
         # Add to history for context
         self.conversation_history.append(
-            ChatMessage(role="assistant", content=assistant_message)
+            {"role": "assistant", "content": assistant_message}
         )
+        self._compact_history()
 
         return assistant_message
 
+    def _summary_message(self) -> ChatMessage:
+        """Build the synthetic message carrying the conversation summary."""
+        return {"role": "system", "content": f"Prior conversation summary: {self.summary}"}
+
+    def _compact_history(self):
+        """Evict the oldest exchanges beyond ``max_turns``.
+
+        Evicted messages are summarized in a background task so the API call
+        overlaps with the user composing their next message.
+        """
+        head = 2 if self.summary else 1
+        excess = len(self.conversation_history) - head - 2 * self.max_turns
+        if excess <= 0:
+            return
+
+        evicted = self.conversation_history[head:head + excess]
+        del self.conversation_history[head:head + excess]
+        self._summary_task = asyncio.create_task(self._summarize(evicted))
+
+    async def _summarize(self, evicted: list[ChatMessage]):
+        """Fold evicted messages into the running conversation summary."""
+        transcript = "\n".join(f"{msg['role']}: {msg['content']}" for msg in evicted)
+        if self.summary:
+            transcript = f"Summary so far: {self.summary}\n\n{transcript}"
+
+        response = await self.client.ai.chat_completions(
+            model=self.model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "Summarize the following conversation concisely, "
+                    "keeping any facts needed to continue it.",
+                },
+                {"role": "user", "content": transcript},
+            ],
+            temperature=0.2,
+        )
+
+        had_summary = bool(self.summary)
+        self.summary = response.text
+        if had_summary:
+            self.conversation_history[1] = self._summary_message()
+        else:
+            self.conversation_history.insert(1, self._summary_message())
+
     def clear_history(self):
         """Clear conversation history, keeping system prompt."""
-        self.conversation_history = [
-            ChatMessage(role="system", content=self.system_prompt)
-        ]
+        if self._summary_task is not None:
+            self._summary_task.cancel()
+            self._summary_task = None
+        self.summary = ""
+        self.conversation_history = list(self._static_prefix)
 
-    def get_history(self) -> list[ChatMessage]:
-        """Get a copy of the conversation history."""
-        return self.conversation_history.copy()
+    def get_history(self) -> tuple[ChatMessage, ...]:
+        """Get a read-only snapshot of the conversation history.
+
+        The messages themselves are shared with the chatbot and must not be
+        modified.
+        """
+        return tuple(self.conversation_history)
 
 
 # ============================================
 # Simple Q&A Example
 # ============================================
 
-async def simple_qa_example():
+async def simple_qa_example(cache: ResponseCache):
     """Demonstrate a simple question and answer."""
-    print("Simple Q&A Example\n")
-
-    response = await client.ai.chat_completions(
+    response = await cache.chat_completions(
         model="luna-gpt-4",
         messages=[
             {"role": "system", "content": "You are a helpful coding assistant."},
@@ -98,19 +213,21 @@ async def simple_qa_example():
         temperature=0.5,
     )
 
+    print("Simple Q&A Example\n")
     print("Question: What is a Python decorator?")
-    print("\nAnswer:", response.choices[0].message.content)
+    print("\nAnswer:", response.text)
 
 
 # ============================================
 # Multi-turn Conversation Example
 # ============================================
 
-async def conversation_example():
+async def conversation_example(client: LunaClient):
     """Demonstrate a multi-turn conversation."""
     print("\nMulti-turn Conversation Example\n")
 
     chatbot = LunaChatbot(
+        client,
         system_prompt="You are a friendly coding tutor. Explain concepts simply.",
         temperature=0.6,
     )
@@ -135,11 +252,12 @@ async def conversation_example():
 # Specialized Assistant Example
 # ============================================
 
-async def specialized_assistant_example():
+async def specialized_assistant_example(client: LunaClient):
     """Demonstrate a specialized code review assistant."""
     print("\nCode Review Assistant Example\n")
 
     code_reviewer = LunaChatbot(
+        client,
         model="luna-gpt-4",
         temperature=0.3,  # Lower temperature for more focused responses
         system_prompt="""You are an expert code reviewer. 
@@ -166,20 +284,21 @@ def fetch_user_data(user_id):
     review = await code_reviewer.chat(
         f"Please review this Python function:\n{code_to_review}"
     )
-    print("\nCode Review:\n", review)
+    print("\nCode Review:")
+    print(review)
 
 
 # ============================================
 # Text Analysis Assistant
 # ============================================
 
-async def text_analysis_example():
+async def text_analysis_example(client: LunaClient, cache: ResponseCache):
     """Demonstrate text analysis capabilities."""
-    print("\nText Analysis Example\n")
-
     analyzer = LunaChatbot(
+        client,
         model="luna-gpt-4",
         temperature=0.2,
+        cache=cache,
         system_prompt="""You are a text analysis assistant. 
             When given text, provide:
             1. A brief summary
@@ -198,21 +317,22 @@ async def text_analysis_example():
     will include AI-powered features and enhanced security capabilities.
     """
 
-    print("Analyzing text...")
     analysis = await analyzer.chat(f"Analyze this text:\n{sample_text}")
-    print("\nAnalysis:\n", analysis)
+    print("\nText Analysis Example\n")
+    print("Analysis:\n", analysis)
 
 
 # ============================================
 # Interactive Chat
 # ============================================
 
-async def interactive_chat():
+async def interactive_chat(client: LunaClient):
     """Run an interactive chat session."""
     print("\nInteractive Chat Mode\n")
     print("Type your messages below. Type 'quit' to exit, 'clear' to reset.\n")
 
     chatbot = LunaChatbot(
+        client,
         system_prompt="You are a helpful AI assistant. Be friendly and informative.",
     )
 
@@ -270,20 +390,38 @@ print()  # Newline after streaming completes
 # ============================================
 
 async def main():
-    """Run all examples."""
-    try:
-        await simple_qa_example()
-        await conversation_example()
-        await specialized_assistant_example()
-        await text_analysis_example()
-        await streaming_example()
+    """Run the examples, overlapping the independent ones."""
+    # A single client (and connection pool) is shared by every example
+    async with LunaClient(api_key=os.environ["LUNA_API_KEY"]) as client:
+        # Shared across examples so repeated questions skip the network
+        cache = ResponseCache(client)
+
+        # These examples are independent and print only once their reply is
+        # complete, so their network round-trips can overlap.
+        examples = (
+            simple_qa_example(cache),
+            text_analysis_example(client, cache),
+            streaming_example(),
+        )
+        results = await asyncio.gather(*examples, return_exceptions=True)
 
-        # Uncomment to start interactive mode
-        # await interactive_chat()
+        errors = [
+            (example, result)
+            for example, result in zip(examples, results)
+            if isinstance(result, Exception)
+        ]
+        for example, error in errors:
+            print(f"Error in {example.__name__}: {error}")
+        if errors:
+            raise errors[0][1]
 
-    except Exception as e:
-        print(f"Error: {e}")
-        raise
+        # These print between turns, so they run one after the other to keep
+        # their output from interleaving.
+        await conversation_example(client)
+        await specialized_assistant_example(client)
+
+        # Uncomment to start interactive mode
+        # await interactive_chat(client)
 
 
 if __name__ == "__main__":
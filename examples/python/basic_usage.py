@@ -8,34 +8,32 @@ Run with: python basic_usage.py
 import asyncio
 import os
 from luna import LunaClient
-
-
-# Initialize the client with API key authentication
-client = LunaClient(api_key=os.environ["LUNA_API_KEY"])
+from luna.errors import NotFoundError, ValidationError, RateLimitError
+from luna.resources.pagination import prefetched
 
 
 # ============================================
 # Example 1: User Management
 # ============================================
 
-async def user_management_example():
+async def user_management_example(client: LunaClient):
     """Demonstrate user CRUD operations."""
-    print("=== User Management ===\n")
+    lines = ["=== User Management ===\n"]
 
     # List users with pagination
     user_list = await client.users.list(limit=10)
-    print(f"Found {len(user_list.data)} users")
+    lines.append(f"Found {len(user_list.data)} users")
 
     # Create a new user
     new_user = await client.users.create(
         email="jane.doe@example.com",
         name="Jane Doe",
     )
-    print(f"Created user: {new_user.id}")
+    lines.append(f"Created user: {new_user.id}")
 
     # Get user details
     user = await client.users.get(new_user.id)
-    print(f"User name: {user.name}, Email: {user.email}")
+    lines.append(f"User name: {user.name}, Email: {user.email}")
 
     # Update the user
     updated_user = await client.users.update(
@@ -43,109 +41,119 @@ async def user_management_example():
         name="Jane M. Doe",
         avatar_url="https://example.com/avatar.jpg",
     )
-    print(f"Updated user name: {updated_user.name}")
+    lines.append(f"Updated user name: {updated_user.name}")
 
     # Delete the user
     await client.users.delete(new_user.id)
-    print("User deleted")
+    lines.append("User deleted")
+
+    return "\n".join(lines)
 
 
 # ============================================
 # Example 2: Project Management
 # ============================================
 
-async def project_management_example():
+async def project_management_example(client: LunaClient):
     """Demonstrate project CRUD operations."""
-    print("\n=== Project Management ===\n")
+    lines = ["\n=== Project Management ===\n"]
 
     # Create a project
     project = await client.projects.create(
         name="My Awesome App",
         description="A revolutionary application built with Luna SDK",
     )
-    print(f"Created project: {project.id}")
+    lines.append(f"Created project: {project.id}")
 
     # List all projects
     projects = await client.projects.list(limit=20)
-    print(f"Total projects: {len(projects.data)}")
+    lines.append(f"Total projects: {len(projects.data)}")
 
     # Get project details
     project_details = await client.projects.get(project.id)
-    print(f"Project: {project_details.name}")
-    print(f"Owner: {project_details.owner_id}")
-    print(f"Created: {project_details.created_at}")
+    lines.append(f"Project: {project_details.name}")
+    lines.append(f"Owner: {project_details.owner_id}")
+    lines.append(f"Created: {project_details.created_at}")
 
     # Update project
     updated = await client.projects.update(
         project.id,
         description="Updated description with new features",
     )
-    print(f"Updated project: {updated.description}")
+    lines.append(f"Updated project: {updated.description}")
 
     # Clean up
     await client.projects.delete(project.id)
-    print("Project deleted")
+    lines.append("Project deleted")
+
+    return "\n".join(lines)
 
 
 # ============================================
 # Example 3: Paginating Through Results
 # ============================================
 
-async def pagination_example():
+async def pagination_example(client: LunaClient):
     """Demonstrate automatic pagination with iterators."""
-    print("\n=== Pagination Example ===\n")
+    lines = ["\n=== Pagination Example ===\n"]
 
-    # Using the async iterator for automatic pagination
+    # Using the async iterator for automatic pagination. prefetched() fetches
+    # the next page while the current one is being processed.
+    # max_items caps the demo at 50 users without fetching further pages.
     count = 0
-    async for user in client.users.iterate(limit=10):
-        print(f"User: {user.name} ({user.email})")
+    users = client.users.iterate(limit=10, max_items=50)
+    async for user in prefetched(users, depth=10):
+        lines.append(f"User: {user.name} ({user.email})")
         count += 1
-        if count >= 50:  # Limit for demo
-            break
-    
-    print(f"Iterated through {count} users")
+
+    lines.append(f"Iterated through {count} users")
+
+    return "\n".join(lines)
 
 
 # ============================================
 # Example 4: Error Handling
 # ============================================
 
-async def error_handling_example():
+async def error_handling_example(client: LunaClient):
     """Demonstrate proper error handling."""
-    print("\n=== Error Handling ===\n")
-
-    from luna.errors import NotFoundError, ValidationError, RateLimitError
+    lines = ["\n=== Error Handling ===\n"]
 
     try:
         # Try to get a non-existent user
         await client.users.get("usr_nonexistent123")
     except NotFoundError as e:
-        print(f"Not found error: {e.message}")
-        print(f"Error code: {e.code}")
+        lines.append(f"Not found error: {e.message}")
+        lines.append(f"Error code: {e.code}")
     except ValidationError as e:
-        print(f"Validation error: {e.message}")
+        lines.append(f"Validation error: {e.message}")
     except RateLimitError as e:
-        print(f"Rate limited! Retry after: {e.retry_after} seconds")
+        lines.append(f"Rate limited! Retry after: {e.retry_after} seconds")
     except Exception as e:
-        print(f"Unexpected error: {e}")
+        lines.append(f"Unexpected error: {e}")
+
+    return "\n".join(lines)
 
 
 # ============================================
 # Example 5: Context Manager Usage
 # ============================================
 
-async def context_manager_example():
-    """Demonstrate using the client as a context manager."""
-    print("\n=== Context Manager Example ===\n")
-
-    async with LunaClient(api_key=os.environ["LUNA_API_KEY"]) as luna:
-        users = await luna.users.list(limit=5)
-        print(f"Found {len(users.data)} users")
-        
-        for user in users.data:
-            print(f"  - {user.name}")
-    
-    print("Client automatically closed")
+async def context_manager_example(client: LunaClient):
+    """Demonstrate using the client as a context manager.
+
+    ``main`` opens the client with ``async with``, so every example shares a
+    single connection pool and the client is closed automatically on exit.
+    """
+    lines = ["\n=== Context Manager Example ===\n"]
+
+    users = await client.users.list(limit=5)
+    lines.append(f"Found {len(users.data)} users")
+
+    for user in users.data:
+        lines.append(f"  - {user.name}")
+
+    return "\n".join(lines)
 
 
 # ============================================
@@ -153,16 +161,33 @@ async def context_manager_example():
 # ============================================
 
 async def main():
-    """Run all examples."""
-    try:
-        await user_management_example()
-        await project_management_example()
-        await pagination_example()
-        await error_handling_example()
-        await context_manager_example()
-    except Exception as e:
-        print(f"Example failed: {e}")
-        raise
+    """Run all examples concurrently."""
+    # Initialize the client with API key authentication. The context manager
+    # shares one connection pool across all examples and closes it on exit.
+    async with LunaClient(api_key=os.environ["LUNA_API_KEY"]) as client:
+        # The examples are independent, so their network round-trips can overlap.
+        examples = (
+            user_management_example(client),
+            project_management_example(client),
+            pagination_example(client),
+            error_handling_example(client),
+            context_manager_example(client),
+        )
+        results = await asyncio.gather(*examples, return_exceptions=True)
+
+    # Each example returns its output, printed here in order so the overlapped
+    # examples don't interleave
+    errors = []
+    for example, result in zip(examples, results):
+        if isinstance(result, Exception):
+            errors.append(result)
+            print(f"Example {example.__name__} failed: {result}")
+        else:
+            print(result)
+
+    print("Client automatically closed")
+    if errors:
+        raise errors[0]
 
 
 if __name__ == "__main__":
@@ -7,16 +7,39 @@ This example demonstrates searching and filtering student residences.
 
 import asyncio
 import os
+import sys
+import time
 from dataclasses import dataclass
 from typing import Optional
 
 from luna import LunaClient
+from luna.types import Campus, ResidenceSearch
+from luna.resources.pagination import prefetched
 
+# Upper bound on in-flight requests when fanning out, to respect rate limits
+MAX_CONCURRENCY = 10
 
-client = LunaClient(api_key=os.environ["LUNA_API_KEY"])
+# Ratings are 0-5, so star strings are built once up front
+_STARS = tuple("*" * i for i in range(6))
 
+_RESIDENCE_TEMPLATE = (
+    "* {name}\n"
+    "   Address: {address}\n"
+    "   Price: {currency_code} {min_price} - {max_price}/month\n"
+    "   Rating: {stars} ({rating})\n"
+    "   Reviews: {review_count}\n"
+    "   NSFAS Accredited: {nsfas}\n"
+    "   Gender Policy: {gender_policy}\n"
+    "   Amenities: {amenities}\n"
+)
 
-@dataclass
+# Campuses rarely change, so the lookup table is fetched once per TTL
+CAMPUS_CACHE_TTL = 3600.0
+_campuses_cache: Optional[dict[str, Campus]] = None
+_campuses_loaded_at = 0.0
+
+
+@dataclass(slots=True)
 class SearchCriteria:
     """Search criteria for finding accommodation."""
     campus_name: Optional[str] = None
@@ -26,28 +49,52 @@ class SearchCriteria:
     min_rating: Optional[float] = None
 
 
+# ============================================
+# Campus Lookup
+# ============================================
+
+async def get_campuses(client: LunaClient) -> dict[str, Campus]:
+    """Get campuses keyed by case-folded name, refreshing after the TTL."""
+    global _campuses_cache, _campuses_loaded_at
+
+    now = time.monotonic()
+    if _campuses_cache is None or now - _campuses_loaded_at > CAMPUS_CACHE_TTL:
+        campuses = await client.resmate.campuses.list()
+        _campuses_cache = {campus.name.casefold(): campus for campus in campuses.data}
+        _campuses_loaded_at = now
+    return _campuses_cache
+
+
+def find_campus(campuses: dict[str, Campus], name: str) -> Optional[Campus]:
+    """Find a campus by exact name, falling back to a substring match."""
+    key = name.casefold()
+    campus = campuses.get(key)
+    if campus is None:
+        campus = next((c for n, c in campuses.items() if key in n), None)
+    return campus
+
+
 # ============================================
 # Student Housing Search Application
 # ============================================
 
-async def find_student_accommodation(criteria: SearchCriteria):
+async def find_student_accommodation(client: LunaClient, criteria: SearchCriteria):
     """Find student accommodation based on search criteria."""
     print("Student Housing Finder\n")
     print(f"Searching with criteria: {criteria}")
     print("-" * 40)
 
-    # First, get available campuses
-    campuses = await client.resmate.campuses.list()
-    print(f"\nAvailable campuses: {len(campuses.data)}")
+    # First, get available campuses (cached across searches)
+    campuses = await get_campuses(client)
+    print(f"\nAvailable campuses: {len(campuses)}")
 
     # Find campus ID if campus name provided
     campus_id = None
     if criteria.campus_name:
-        for campus in campuses.data:
-            if criteria.campus_name.lower() in campus.name.lower():
-                campus_id = campus.id
-                print(f"Found campus: {campus.name}")
-                break
+        campus = find_campus(campuses, criteria.campus_name)
+        if campus:
+            campus_id = campus.id
+            print(f"Found campus: {campus.name}")
 
     # Search for residences with filters
     residences = await client.resmate.residences.list(
@@ -61,20 +108,24 @@ async def find_student_accommodation(criteria: SearchCriteria):
 
     print(f"\nFound {len(residences.data)} matching residences:\n")
 
-    # Display results
-    for residence in residences.data:
-        stars = "*" * round(residence.rating)
-        nsfas_status = "Yes" if residence.is_nsfas_accredited else "No"
-        
-        print(f"* {residence.name}")
-        print(f"   Address: {residence.address}")
-        print(f"   Price: {residence.currency_code} {residence.min_price} - {residence.max_price}/month")
-        print(f"   Rating: {stars} ({residence.rating})")
-        print(f"   Reviews: {residence.review_count}")
-        print(f"   NSFAS Accredited: {nsfas_status}")
-        print(f"   Gender Policy: {residence.gender_policy}")
-        print(f"   Amenities: {', '.join(residence.amenities[:5])}")
-        print()
+    # Display results, buffered into a single write
+    parts = [
+        _RESIDENCE_TEMPLATE.format_map({
+            "name": residence.name,
+            "address": residence.address,
+            "currency_code": residence.currency_code,
+            "min_price": residence.min_price,
+            "max_price": residence.max_price,
+            "stars": _STARS[round(residence.rating)],
+            "rating": residence.rating,
+            "review_count": residence.review_count,
+            "nsfas": "Yes" if residence.is_nsfas_accredited else "No",
+            "gender_policy": residence.gender_policy,
+            "amenities": ", ".join(residence.amenities[:5]),
+        })
+        for residence in residences.data
+    ]
+    sys.stdout.write("\n".join(parts) + "\n")
 
     return residences.data
 
@@ -83,38 +134,40 @@ async def find_student_accommodation(criteria: SearchCriteria):
 # Get Detailed Residence Information
 # ============================================
 
-async def get_residence_details(residence_id: str):
+async def get_residence_details(client: LunaClient, residence_id: str):
     """Get detailed information about a specific residence."""
     print("\nFetching detailed information...\n")
 
     residence = await client.resmate.residences.get(residence_id)
 
-    print(f"{residence.name}")
-    print("=" * 50)
-    
-    print(f"\nLocation")
-    print(f"   Address: {residence.address}")
-    print(f"   City: {residence.location.get('city', 'N/A')}")
-    print(f"   Suburb: {residence.location.get('suburb', 'N/A')}")
-    print(f"   Coordinates: {residence.location['latitude']}, {residence.location['longitude']}")
-
-    print(f"\nPricing")
-    print(f"   Range: {residence.currency_code} {residence.min_price} - {residence.max_price}")
-    print(f"   NSFAS Accredited: {'Yes' if residence.is_nsfas_accredited else 'No'}")
-
-    print(f"\nDetails")
-    print(f"   Gender Policy: {residence.gender_policy}")
-    print(f"   Description: {residence.description or 'No description available'}")
-
-    print(f"\nReviews")
-    print(f"   Rating: {residence.rating}/5")
-    print(f"   Total Reviews: {residence.review_count}")
-
-    print(f"\nAmenities")
-    for amenity in residence.amenities:
-        print(f"   • {amenity}")
-
-    print(f"\n🖼️ Images: {len(residence.images)} available")
+    parts = [
+        residence.name,
+        "=" * 50,
+        "",
+        "Location",
+        f"   Address: {residence.address}",
+        f"   City: {residence.location.get('city', 'N/A')}",
+        f"   Suburb: {residence.location.get('suburb', 'N/A')}",
+        f"   Coordinates: {residence.location['latitude']}, {residence.location['longitude']}",
+        "",
+        "Pricing",
+        f"   Range: {residence.currency_code} {residence.min_price} - {residence.max_price}",
+        f"   NSFAS Accredited: {'Yes' if residence.is_nsfas_accredited else 'No'}",
+        "",
+        "Details",
+        f"   Gender Policy: {residence.gender_policy}",
+        f"   Description: {residence.description or 'No description available'}",
+        "",
+        "Reviews",
+        f"   Rating: {residence.rating}/5",
+        f"   Total Reviews: {residence.review_count}",
+        "",
+        "Amenities",
+        *(f"   • {amenity}" for amenity in residence.amenities),
+        "",
+        f"🖼️ Images: {len(residence.images)} available",
+    ]
+    sys.stdout.write("\n".join(parts) + "\n")
 
     return residence
 
@@ -123,86 +176,60 @@ async def get_residence_details(residence_id: str):
 # Browse All Residences with Pagination
 # ============================================
 
-async def browse_all_residences():
+async def browse_all_residences(client: LunaClient):
     """Browse all residences using automatic pagination."""
     print("\n📚 Browsing all residences...\n")
 
     total_count = 0
     summaries = []
 
-    # Use async iterator to go through all pages
-    async for residence in client.resmate.residences.iterate(limit=10):
+    # Use async iterator to go through all pages, fetching the next page
+    # while the current one is being processed. max_items limits the demo
+    # to 30 results without requesting any further pages.
+    residences = client.resmate.residences.iterate(ResidenceSearch(limit=10), max_items=30)
+    async for residence in prefetched(residences, depth=10):
         summaries.append(
             f"{residence.name} - {residence.currency_code} {residence.min_price}+ ({residence.rating} stars)"
         )
         total_count += 1
 
-        # Limit for demo purposes
-        if total_count >= 30:
-            print("(Showing first 30 results)")
-            break
+    if total_count >= 30:
+        print("(Showing first 30 results)")
 
     print(f"Total residences found: {total_count}\n")
-    for i, summary in enumerate(summaries, 1):
-        print(f"{i}. {summary}")
+    sys.stdout.write(
+        "".join(f"{i}. {summary}\n" for i, summary in enumerate(summaries, 1))
+    )
 
 
 # ============================================
 # Compare Residences
 # ============================================
 
-async def compare_residences(residence_ids: list[str]):
+async def compare_residences(client: LunaClient, residence_ids: list[str]):
     """Compare multiple residences side by side."""
     print("\n⚖️ Residence Comparison\n")
     print("=" * 80)
 
-    residences = []
-    for rid in residence_ids:
-        res = await client.resmate.residences.get(rid)
-        residences.append(res)
-
-    # Header
-    print(f"{'Feature':<20}", end="")
-    for res in residences:
-        print(f"{res.name[:15]:<18}", end="")
-    print()
-    print("-" * 80)
-
-    # Price range
-    print(f"{'Min Price':<20}", end="")
-    for res in residences:
-        print(f"{res.currency_code} {res.min_price:<12}", end="")
-    print()
-
-    print(f"{'Max Price':<20}", end="")
-    for res in residences:
-        print(f"{res.currency_code} {res.max_price:<12}", end="")
-    print()
-
-    # Rating
-    print(f"{'Rating':<20}", end="")
-    for res in residences:
-        print(f"{'*' * round(res.rating):<18}", end="")
-    print()
-
-    # NSFAS
-    print(f"{'NSFAS':<20}", end="")
-    for res in residences:
-        status = "Yes" if res.is_nsfas_accredited else "No"
-        print(f"{status:<18}", end="")
-    print()
-
-    # Gender
-    print(f"{'Gender Policy':<20}", end="")
-    for res in residences:
-        print(f"{res.gender_policy:<18}", end="")
-    print()
-
-    # Amenities count
-    print(f"{'Amenities':<20}", end="")
-    for res in residences:
-        print(f"{len(res.amenities)} available{'':<6}", end="")
-    print()
+    # Fetch all residences concurrently instead of one round-trip at a time
+    residences = await client.resmate.residences.get_many(
+        residence_ids, max_concurrency=MAX_CONCURRENCY
+    )
+
+    def row(label: str, cells) -> str:
+        return f"{label:<20}" + "".join(cells)
+
+    lines = [
+        row("Feature", (f"{res.name[:15]:<18}" for res in residences)),
+        "-" * 80,
+        row("Min Price", (f"{res.currency_code} {res.min_price:<12}" for res in residences)),
+        row("Max Price", (f"{res.currency_code} {res.max_price:<12}" for res in residences)),
+        row("Rating", (f"{_STARS[round(res.rating)]:<18}" for res in residences)),
+        row("NSFAS", (f"{'Yes' if res.is_nsfas_accredited else 'No':<18}" for res in residences)),
+        row("Gender Policy", (f"{res.gender_policy:<18}" for res in residences)),
+        row("Amenities", (f"{len(res.amenities)} available{'':<6}" for res in residences)),
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ============================================
@@ -211,39 +238,43 @@ async def compare_residences(residence_ids: list[str]):
 
 async def main():
     """Run the student housing finder."""
-    try:
-        # Example 1: Find budget-friendly NSFAS accommodation
-        nsfas_results = await find_student_accommodation(
-            SearchCriteria(
-                requires_nsfas=True,
-                max_budget=5000,
-                min_rating=3.5,
+    # A single client (and connection pool) is shared by every example
+    async with LunaClient(api_key=os.environ["LUNA_API_KEY"]) as client:
+        try:
+            # Example 1: Find budget-friendly NSFAS accommodation
+            nsfas_results = await find_student_accommodation(
+                client,
+                SearchCriteria(
+                    requires_nsfas=True,
+                    max_budget=5000,
+                    min_rating=3.5,
+                )
             )
-        )
 
-        # Example 2: Find mixed-gender housing near a specific campus
-        await find_student_accommodation(
-            SearchCriteria(
-                campus_name="University",
-                gender="mixed",
-                max_budget=8000,
+            # Example 2: Find mixed-gender housing near a specific campus
+            await find_student_accommodation(
+                client,
+                SearchCriteria(
+                    campus_name="University",
+                    gender="mixed",
+                    max_budget=8000,
+                )
             )
-        )
 
-        # Example 3: Get details for the first result
-        if nsfas_results:
-            await get_residence_details(nsfas_results[0].id)
+            # Example 3: Get details for the first result
+            if nsfas_results:
+                await get_residence_details(client, nsfas_results[0].id)
 
-        # Example 4: Browse all available residences
-        await browse_all_residences()
+            # Example 4: Browse all available residences
+            await browse_all_residences(client)
 
-        # Example 5: Compare residences (if we have multiple results)
-        if len(nsfas_results) >= 2:
-            await compare_residences([r.id for r in nsfas_results[:3]])
+            # Example 5: Compare residences (if we have multiple results)
+            if len(nsfas_results) >= 2:
+                await compare_residences(client, [r.id for r in nsfas_results[:3]])
 
-    except Exception as e:
-        print(f"Application error: {e}")
-        raise
+        except Exception as e:
+            print(f"Application error: {e}")
+            raise
 
 
 if __name__ == "__main__":
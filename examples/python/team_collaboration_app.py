@@ -11,18 +11,15 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-from luna import LunaClient
-from luna.errors import NotFoundError, ValidationError
-
-
-client = LunaClient(api_key=os.environ["LUNA_API_KEY"])
+from luna import LunaClient, User
+from luna.errors import ConflictError, NotFoundError, ValidationError
 
 
 # ============================================
 # Team Collaboration Application
 # ============================================
 
-@dataclass
+@dataclass(slots=True)
 class TeamMember:
     """Represents a team member."""
     user_id: str
@@ -31,7 +28,7 @@ class TeamMember:
     role: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Team:
     """Represents a team with members and projects."""
     project_id: str
@@ -42,8 +39,11 @@ class Team:
 class TeamCollaborationApp:
     """A team collaboration application built with Luna SDK."""
 
-    def __init__(self):
+    def __init__(self, client: LunaClient):
+        self.client = client
         self.current_team: Optional[Team] = None
+        # email -> user, so repeated lookups in a session skip the API
+        self._email_cache: dict[str, User] = {}
 
     # ============================================
     # Team Management
@@ -54,7 +54,7 @@ class TeamCollaborationApp:
         print(f"\nCreating team: {name}")
 
         # Create project as the team container
-        project = await client.projects.create(
+        project = await self.client.projects.create(
             name=name,
             description=description,
         )
@@ -73,19 +73,24 @@ class TeamCollaborationApp:
         print(f"\nAdding member: {name}")
 
         # Create or find user
-        try:
-            user = await client.users.create(
-                email=email,
-                name=name,
-            )
-            print(f"   Created new user: {user.id}")
-        except ValidationError:
-            # User might already exist
-            users = await client.users.list(limit=100)
-            user = next((u for u in users.data if u.email == email), None)
-            if not user:
-                raise ValueError(f"Could not find or create user with email: {email}")
+        user = self._email_cache.get(email)
+        if user is not None:
             print(f"   Found existing user: {user.id}")
+        else:
+            try:
+                user = await self.client.users.create(
+                    email=email,
+                    name=name,
+                )
+                print(f"   Created new user: {user.id}")
+            except (ConflictError, ValidationError):
+                # The API reports an existing email as a 400 (ValidationError);
+                # ConflictError covers servers that answer with a 409.
+                user = await self._find_user_by_email(email)
+                if not user:
+                    raise ValueError(f"Could not find or create user with email: {email}")
+                print(f"   Found existing user: {user.id}")
+            self._email_cache[email] = user
 
         member = TeamMember(
             user_id=user.id,
@@ -98,6 +103,13 @@ class TeamCollaborationApp:
         print(f"{name} added as {role}")
         return member
 
+    async def _find_user_by_email(self, email: str) -> Optional[User]:
+        """Find a user by email, stopping at the first matching page."""
+        async for user in self.client.users.iterate(limit=50):
+            if user.email == email:
+                return user
+        return None
+
     async def list_members(self, team: Team):
         """List all team members."""
         print(f"\nTeam: {team.name}")
@@ -121,10 +133,10 @@ class TeamCollaborationApp:
         print(f"\nGenerating project summary...")
 
         # Get project details
-        project = await client.projects.get(team.project_id)
+        project = await self.client.projects.get(team.project_id)
 
         # Generate summary using AI
-        response = await client.ai.chat_completions(
+        response = await self.client.ai.chat_completions(
             model="luna-gpt-4",
             messages=[
                 {
@@ -149,7 +161,7 @@ Include:
             temperature=0.5,
         )
 
-        summary = response.choices[0].message.content
+        summary = response.text
         print("\nProject Summary:\n")
         print(summary)
         return summary
@@ -158,7 +170,7 @@ Include:
         """Use AI to suggest tasks for the team."""
         print(f"\nGenerating task suggestions...")
 
-        response = await client.ai.chat_completions(
+        response = await self.client.ai.chat_completions(
             model="luna-gpt-4",
             messages=[
                 {
@@ -179,7 +191,7 @@ Format as a numbered list with assigned team member (if applicable).""",
             temperature=0.7,
         )
 
-        tasks = response.choices[0].message.content
+        tasks = response.text
         print("\nSuggested Tasks:\n")
         print(tasks)
         return tasks
@@ -192,7 +204,7 @@ Format as a numbered list with assigned team member (if applicable).""",
         """Set up file storage for the team."""
         print(f"\nSetting up team storage...")
 
-        buckets = await client.storage.buckets.list()
+        buckets = await self.client.storage.buckets.list()
         print(f"   Available buckets: {len(buckets.data)}")
 
         if buckets.data:
@@ -201,7 +213,7 @@ Format as a numbered list with assigned team member (if applicable).""",
             print(f"   Region: {bucket.region}")
 
             # List existing files
-            files = await client.storage.files.list(bucket.id)
+            files = await self.client.storage.files.list(bucket.id)
             print(f"   Existing files: {len(files.data)}")
 
     # ============================================
@@ -212,7 +224,7 @@ Format as a numbered list with assigned team member (if applicable).""",
         """Set up automation workflows for the team."""
         print(f"\nSetting up team workflows...")
 
-        workflows = await client.automation.workflows.list()
+        workflows = await self.client.automation.workflows.list()
         active_workflows = [w for w in workflows.data if w.is_active]
 
         print(f"   Available workflows: {len(workflows.data)}")
@@ -262,52 +274,55 @@ Format as a numbered list with assigned team member (if applicable).""",
 
 async def main():
     """Run the team collaboration application."""
-    app = TeamCollaborationApp()
-
-    try:
-        # Create a new team
-        team = await app.create_team(
-            name="Project Phoenix",
-            description="A revolutionary new product development initiative",
-        )
-
-        # Add team members
-        await app.add_member(team, "alice@example.com", "Alice Johnson", "Project Lead")
-        await app.add_member(team, "bob@example.com", "Bob Smith", "Developer")
-        await app.add_member(team, "carol@example.com", "Carol Williams", "Designer")
+    # A single client (and connection pool) is shared by the whole app
+    async with LunaClient(api_key=os.environ["LUNA_API_KEY"]) as client:
+        app = TeamCollaborationApp(client)
 
-        # Show dashboard
-        await app.show_dashboard(team)
-
-        # Generate AI-powered project summary
-        await app.generate_project_summary(team)
-
-        # Get task suggestions
-        await app.suggest_tasks(
-            team,
-            context="We're starting a new mobile app project. We need to set up the development environment and create initial designs.",
-        )
+        try:
+            # Create a new team
+            team = await app.create_team(
+                name="Project Phoenix",
+                description="A revolutionary new product development initiative",
+            )
 
-        # Set up storage and workflows
-        await app.setup_team_storage(team)
-        await app.setup_team_workflows(team)
+            # Add team members
+            await app.add_member(team, "alice@example.com", "Alice Johnson", "Project Lead")
+            await app.add_member(team, "bob@example.com", "Bob Smith", "Developer")
+            await app.add_member(team, "carol@example.com", "Carol Williams", "Designer")
+
+            # Show dashboard
+            await app.show_dashboard(team)
+
+            # Generate AI-powered project summary and task suggestions.
+            # The two requests are independent, so run them concurrently.
+            await asyncio.gather(
+                app.generate_project_summary(team),
+                app.suggest_tasks(
+                    team,
+                    context="We're starting a new mobile app project. We need to set up the development environment and create initial designs.",
+                ),
+            )
 
-        # Cleanup (comment out to keep the team)
-        print("\nCleaning up...")
-        for member in team.members:
-            try:
-                await client.users.delete(member.user_id)
-                print(f"   Deleted user: {member.name}")
-            except NotFoundError:
-                pass
-
-        await client.projects.delete(team.project_id)
-        print(f"   Deleted project: {team.name}")
-        print("Cleanup complete")
-
-    except Exception as e:
-        print(f"Application error: {e}")
-        raise
+            # Set up storage and workflows
+            await app.setup_team_storage(team)
+            await app.setup_team_workflows(team)
+
+            # Cleanup (comment out to keep the team)
+            print("\nCleaning up...")
+            for member in team.members:
+                try:
+                    await client.users.delete(member.user_id)
+                    print(f"   Deleted user: {member.name}")
+                except NotFoundError:
+                    pass
+
+            await client.projects.delete(team.project_id)
+            print(f"   Deleted project: {team.name}")
+            print("Cleanup complete")
+
+        except Exception as e:
+            print(f"Application error: {e}")
+            raise
 
 
 if __name__ == "__main__":
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+from types import MappingProxyType
+from typing import Mapping
 
 from luna.auth.types import AuthProvider
 from luna.errors.base import AuthenticationError
@@ -44,10 +46,11 @@ class ApiKeyAuth(AuthProvider):
                 request_id="local",
             )
         self._api_key = api_key
+        self._headers = MappingProxyType({"X-Luna-Api-Key": api_key})
 
-    async def get_headers(self) -> dict[str, str]:
+    async def get_headers(self) -> Mapping[str, str]:
         """Get authorization headers with API key."""
-        return {"X-Luna-Api-Key": self._api_key}
+        return self._headers
 
     def needs_refresh(self) -> bool:
         """API keys don't expire."""
@@ -7,8 +7,6 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
 
-import keyring
-
 from luna.auth.types import TokenPair
 
 
@@ -38,6 +36,9 @@ class KeyringTokenStore(TokenStore):
     Uses the 'keyring' library to securely store credentials
     in the operating system's credential manager (Keychain on macOS,
     Credential Vault on Windows, Secret Service on Linux).
+
+    ``keyring`` is imported on first use; loading its backends is the
+    slowest part of importing the SDK otherwise.
     """
 
     def __init__(self, service_name: str = "luna-sdk", account_name: str = "default") -> None:
@@ -47,6 +48,8 @@ class KeyringTokenStore(TokenStore):
         self._account_expires = f"{account_name}_expires"
 
     def save(self, tokens: TokenPair) -> None:
+        import keyring
+
         keyring.set_password(self._service, self._account_access, tokens.access_token)
         if tokens.refresh_token:
             keyring.set_password(self._service, self._account_refresh, tokens.refresh_token)
@@ -54,6 +57,8 @@ class KeyringTokenStore(TokenStore):
             keyring.set_password(self._service, self._account_expires, tokens.expires_at.isoformat())
 
     def load(self) -> TokenPair | None:
+        import keyring
+
         access_token = keyring.get_password(self._service, self._account_access)
         if not access_token:
             return None
@@ -68,6 +73,8 @@ class KeyringTokenStore(TokenStore):
         )
 
     def clear(self) -> None:
+        import keyring
+
         try:
             keyring.delete_password(self._service, self._account_access)
             keyring.delete_password(self._service, self._account_refresh)
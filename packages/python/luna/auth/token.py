@@ -1,12 +1,19 @@
 from __future__ import annotations
 import asyncio
+import time
 from datetime import datetime, timedelta
-from typing import Awaitable, Callable
-import httpx
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Awaitable, Callable, Mapping
 from luna.auth.types import AuthProvider, TokenPair
 from luna.errors.base import AuthenticationError
 from luna.errors.codes import ErrorCode
 
+if TYPE_CHECKING:
+    import httpx
+
+# Refresh this long before the token actually expires
+_REFRESH_MARGIN_SECONDS = 300
+
 class TokenAuth(AuthProvider):
     def __init__(
         self,
@@ -14,6 +21,7 @@ class TokenAuth(AuthProvider):
         refresh_token: str | None = None,
         expires_at: datetime | None = None,
         on_refresh: Callable[[TokenPair], Awaitable[None]] | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         if not access_token:
             raise AuthenticationError(
@@ -25,53 +33,92 @@ class TokenAuth(AuthProvider):
         self._refresh_token = refresh_token
         self._expires_at = expires_at
         self._on_refresh = on_refresh
-        self._refresh_lock = asyncio.Lock()
+        # The refresh in flight, shared by every caller that needs it
+        self._refresh_task: asyncio.Task[None] | None = None
+        # Reused across refreshes so keep-alive connections skip the TLS handshake
+        self._http = http_client
+        self._owns_http = http_client is None
+        self._on_tokens_changed()
+
+    def _on_tokens_changed(self) -> None:
+        # get_headers/needs_refresh run on every request, so derive what they
+        # need once per token rotation instead of per call
+        self._auth_header = MappingProxyType(
+            {"Authorization": f"Bearer {self._access_token}"}
+        )
+        self._refresh_after = (
+            self._expires_at.timestamp() - _REFRESH_MARGIN_SECONDS
+            if self._expires_at is not None
+            else None
+        )
 
-    async def get_headers(self) -> dict[str, str]:
+    async def get_headers(self) -> Mapping[str, str]:
         if self.needs_refresh():
             await self.refresh()
-        return {"Authorization": f"Bearer {self._access_token}"}
+        return self._auth_header
 
     def needs_refresh(self) -> bool:
-        if self._expires_at is None: return False
-        return datetime.now() + timedelta(minutes=5) >= self._expires_at
+        return self._refresh_after is not None and time.time() >= self._refresh_after
 
     async def refresh(self) -> None:
-        async with self._refresh_lock:
+        task = self._refresh_task
+        if task is None:
             if not self.needs_refresh(): return
-            if not self._refresh_token:
-                raise AuthenticationError(
-                    code=ErrorCode.AUTH_INVALID_KEY,
-                    message="No refresh token available",
-                    request_id="local"
-                )
+            task = self._refresh_task = asyncio.create_task(self._do_refresh())
+            task.add_done_callback(self._refresh_done)
+        # Shielded so one cancelled caller doesn't abort the refresh for the rest
+        await asyncio.shield(task)
+
+    def _refresh_done(self, task: asyncio.Task[None]) -> None:
+        if self._refresh_task is task:
+            self._refresh_task = None
+
+    async def _do_refresh(self) -> None:
+        if not self._refresh_token:
+            raise AuthenticationError(
+                code=ErrorCode.AUTH_INVALID_KEY,
+                message="No refresh token available",
+                request_id="local"
+            )
+
+        if self._http is None:
+            # Deferred so apps that never refresh don't pay for importing httpx
+            import httpx
+
+            self._http = httpx.AsyncClient(timeout=10.0)
+        resp = await self._http.post(
+            "https://api.eclipse.dev/v1/auth/refresh",
+            json={"refresh_token": self._refresh_token},
+        )
+        if not resp.is_success:
+            raise AuthenticationError(
+                code=ErrorCode.AUTH_TOKEN_EXPIRED,
+                message=f"Refresh failed: {resp.status_code}",
+                request_id=resp.headers.get("x-request-id", "unknown")
+            )
+        data = resp.json()
 
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(
-                    "https://api.eclipse.dev/v1/auth/refresh",
-                    json={"refresh_token": self._refresh_token},
-                )
-                if not resp.is_success:
-                    raise AuthenticationError(
-                        code=ErrorCode.AUTH_TOKEN_EXPIRED,
-                        message=f"Refresh failed: {resp.status_code}",
-                        request_id=resp.headers.get("x-request-id", "unknown")
-                    )
-                data = resp.json()
+        self._access_token = data["access_token"]
+        self._refresh_token = data["refresh_token"]
+        self._expires_at = datetime.now() + timedelta(seconds=data["expires_in"])
+        self._on_tokens_changed()
 
-            self._access_token = data["access_token"]
-            self._refresh_token = data["refresh_token"]
-            self._expires_at = datetime.now() + timedelta(seconds=data["expires_in"])
+        if self._on_refresh:
+            await self._on_refresh(TokenPair(
+                access_token=self._access_token,
+                refresh_token=self._refresh_token,
+                expires_at=self._expires_at
+            ))
 
-            if self._on_refresh:
-                await self._on_refresh(TokenPair(
-                    access_token=self._access_token,
-                    refresh_token=self._refresh_token,
-                    expires_at=self._expires_at
-                ))
+    async def aclose(self) -> None:
+        """Close the refresh HTTP client if this provider created it."""
+        if self._http is not None and self._owns_http:
+            await self._http.aclose()
+            self._http = None
 
     def update_tokens(self, tokens: TokenPair) -> None:
         """Update tokens manually."""
         self._access_token = tokens.access_token
         self._refresh_token = tokens.refresh_token
         self._expires_at = tokens.expires_at
+        self._on_tokens_changed()
@@ -5,7 +5,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Awaitable, Callable
+from typing import Awaitable, Callable, Mapping
 
 
 @dataclass
@@ -24,8 +24,13 @@ class AuthProvider(ABC):
     """Interface for authentication providers."""
 
     @abstractmethod
-    async def get_headers(self) -> dict[str, str]:
-        """Get authorization headers for a request."""
+    async def get_headers(self) -> Mapping[str, str]:
+        """
+        Get authorization headers for a request.
+
+        The returned mapping may be shared between calls and must not be
+        modified; copy it to add headers.
+        """
         ...
 
     @abstractmethod
@@ -36,3 +41,7 @@ class AuthProvider(ABC):
     async def refresh(self) -> None:
         """Refresh credentials if needed."""
         pass
+
+    async def aclose(self) -> None:
+        """Release any resources held by the provider."""
+        pass
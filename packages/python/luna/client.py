@@ -33,6 +33,8 @@ class ClientConfig:
         max_retries: int = 3,
         logger: Logger | None = None,
         log_level: LogLevel = "info",
+        max_concurrency: int | None = None,
+        rate_limit: int | None = None,
     ) -> None:
         self.api_key = api_key
         self.access_token = access_token
@@ -43,6 +45,8 @@ class ClientConfig:
         self.max_retries = max_retries
         self.logger = logger
         self.log_level = log_level
+        self.max_concurrency = max_concurrency
+        self.rate_limit = rate_limit
 
 
 class LunaClient:
@@ -80,6 +84,8 @@ class LunaClient:
         messaging: MessagingConfig | None = None,
         za_tools: ZAToolsConfig | None = None,
         strict: bool = False,
+        max_concurrency: int | None = None,
+        rate_limit: int | None = None,
     ) -> None:
         """
         Initialize the Luna client.
@@ -97,6 +103,8 @@ class LunaClient:
             payments: South African payment gateways configuration
             messaging: Messaging (SMS, WhatsApp, USSD) configuration
             za_tools: South African business tools configuration
+            max_concurrency: Maximum number of requests in flight at once
+            rate_limit: Maximum number of requests started per minute
         """
         # Auto-configure from environment ("Spring Boot" style)
         if not api_key:
@@ -109,6 +117,11 @@ class LunaClient:
         if env_base_url and base_url == "https://api.eclipse.dev":
             base_url = env_base_url
 
+        if max_concurrency is None and os.environ.get("LUNA_MAX_CONCURRENCY"):
+            max_concurrency = int(os.environ["LUNA_MAX_CONCURRENCY"])
+        if rate_limit is None and os.environ.get("LUNA_RATE_LIMIT"):
+            rate_limit = int(os.environ["LUNA_RATE_LIMIT"])
+
         if not api_key and not access_token:
             raise ValueError("Either api_key or access_token must be provided (or set via LUNA_API_KEY/LUNA_ACCESS_TOKEN)")
 
@@ -127,6 +140,8 @@ class LunaClient:
                 on_refresh=on_token_refresh,
             )
 
+        self._auth_provider = auth_provider
+
         # Set up HTTP client
         self._http_client = HttpClient(
             base_url=base_url.rstrip("/"),
@@ -134,6 +149,8 @@ class LunaClient:
             max_retries=max_retries,
             auth_provider=auth_provider,
             logger=self._logger,
+            max_concurrency=max_concurrency,
+            rate_limit=rate_limit,
         )
 
         # Initialize resources
@@ -166,7 +183,9 @@ class LunaClient:
 
     async def close(self) -> None:
         """Close the HTTP client connection."""
+        await self.messaging.aclose()
         await self._http_client.close()
+        await self._auth_provider.aclose()
 
     async def __aenter__(self) -> "LunaClient":
         """Async context manager entry."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import random
 import time
 from typing import Any, TypeVar
@@ -10,9 +11,15 @@ from urllib.parse import urlencode
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 from luna.auth.types import AuthProvider
 from luna.errors import LunaError, NetworkError, create_error
 from luna.errors.codes import ErrorCode
+from luna.http.limits import RateLimiter
 from luna.http.types import RequestConfig, Response, RetryConfig
 from luna.telemetry import Logger
 from luna.utils.system import get_system_info
@@ -20,6 +27,13 @@ from luna.utils.system import get_system_info
 T = TypeVar("T")
 
 
+def _encode_json(body: Any) -> bytes:
+    """Serialize a request body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(body)
+    return json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode()
+
+
 class HttpClient:
     """HTTP client with authentication, retry, and telemetry."""
 
@@ -30,6 +44,8 @@ class HttpClient:
         max_retries: int,
         auth_provider: AuthProvider,
         logger: Logger,
+        max_concurrency: int | None = None,
+        rate_limit: int | None = None,
     ) -> None:
         self._base_url = base_url
         self._timeout = timeout
@@ -37,6 +53,10 @@ class HttpClient:
         self._logger = logger
         self._retry_config = RetryConfig(max_retries=max_retries)
         self._client: httpx.AsyncClient | None = None
+        # Optional client-side limits so concurrent callers stay under the
+        # provider's rate limits instead of triggering 429 storms
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._rate_limiter = RateLimiter(rate_limit) if rate_limit else None
 
     async def __aenter__(self) -> "HttpClient":
         """Enter async context."""
@@ -76,7 +96,7 @@ class HttpClient:
 
         while True:
             try:
-                response = await self._execute_request(url, config, request_id)
+                response = await self._send(url, config, request_id)
                 self._logger.info(
                     "HTTP request completed",
                     {
@@ -124,6 +144,17 @@ class HttpClient:
                 await self._wait_for_retry(attempt, retry_after)
                 attempt += 1
 
+    async def _send(
+        self, url: str, config: RequestConfig, request_id: str
+    ) -> Response[Any]:
+        """Execute a request within the configured concurrency and rate limits."""
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+        if self._semaphore is None:
+            return await self._execute_request(url, config, request_id)
+        async with self._semaphore:
+            return await self._execute_request(url, config, request_id)
+
     async def _execute_request(
         self, url: str, config: RequestConfig, request_id: str
     ) -> Response[Any]:
@@ -163,8 +194,8 @@ class HttpClient:
             if config.body:
                 kwargs["data"] = config.body
         elif config.body is not None:
-             # Standard JSON request
-             kwargs["json"] = config.body
+             # Standard JSON request. Content-Type is already set above.
+             kwargs["content"] = _encode_json(config.body)
 
         try:
             response = await client.request(**kwargs)
@@ -0,0 +1,39 @@
+"""Client-side request rate limiting."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket limiting how many requests may start per period.
+
+    Allows bursts of up to ``rate`` requests, then refills at
+    ``rate / per`` tokens per second.
+    """
+
+    def __init__(self, rate: int, per: float = 60.0) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._capacity = float(rate)
+        self._tokens = float(rate)
+        self._fill_rate = rate / per
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated) * self._fill_rate,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._fill_rate)
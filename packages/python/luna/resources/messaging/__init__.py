@@ -18,8 +18,10 @@ from .types import (
     MessageStatus,
     USSDState,
     SMSSendRequest,
+    SMSBulkSendRequest,
     SMSMessage,
     SMSBulkResult,
+    SMSFailure,
     WhatsAppTextRequest,
     WhatsAppTemplateRequest,
     WhatsAppMediaRequest,
@@ -47,8 +49,10 @@ __all__ = [
     "MessageStatus",
     "USSDState",
     "SMSSendRequest",
+    "SMSBulkSendRequest",
     "SMSMessage",
     "SMSBulkResult",
+    "SMSFailure",
     "WhatsAppTextRequest",
     "WhatsAppTemplateRequest",
     "WhatsAppMediaRequest",
@@ -126,6 +130,11 @@ class Messaging:
             self._ussd = USSD(self._client, self._config.ussd)
         return self._ussd
 
+    async def aclose(self) -> None:
+        """Flush any buffered messages."""
+        if self._sms:
+            await self._sms.aclose()
+
     def list(self) -> list[str]:
         """List available messaging channels."""
         available = []
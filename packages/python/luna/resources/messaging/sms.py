@@ -2,12 +2,109 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 from datetime import datetime
-from typing import Optional
+from time import time_ns
+from typing import Awaitable, Callable, Optional
 
 from luna.http import HttpClient
-from .types import SMSConfig, SMSSendRequest, SMSMessage, SMSBulkResult
+from .types import (
+    SMSConfig,
+    SMSSendRequest,
+    SMSBulkSendRequest,
+    SMSMessage,
+    SMSBulkResult,
+    SMSFailure,
+)
+
+# Strips every ASCII non-digit; non-ASCII input falls back to the regex so
+# Unicode digits are handled exactly as before
+_NON_DIGITS = re.compile(r"\D")
+_STRIP_NON_DIGITS = str.maketrans("", "", "".join(
+    chr(c) for c in range(128) if not chr(c).isdigit()
+))
+
+
+def _recipient(request: SMSSendRequest) -> str:
+    return request.to[0] if isinstance(request.to, list) else request.to
+
+
+class _SMSBatcher:
+    """Collects individually submitted messages and sends them in batches.
+
+    A batch is flushed once ``max_size`` messages are waiting or ``window``
+    seconds after its first message arrived, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[list[SMSSendRequest]], Awaitable[list[SMSMessage | Exception]]],
+        max_size: int,
+        window: float,
+    ) -> None:
+        self._flush = flush
+        self._max_size = max(1, max_size)
+        self._window = window
+        self._queue: asyncio.Queue[
+            tuple[SMSSendRequest, asyncio.Future[SMSMessage]] | None
+        ] = asyncio.Queue()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def submit(self, request: SMSSendRequest) -> asyncio.Future[SMSMessage]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[SMSMessage] = loop.create_future()
+        self._queue.put_nowait((request, future))
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+        return future
+
+    async def aclose(self) -> None:
+        """Send everything still buffered and stop the background task."""
+        if self._task is None or self._task.done():
+            return
+        self._queue.put_nowait(None)
+        await self._task
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = loop.time() + self._window
+            closing = False
+            while len(batch) < self._max_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    closing = True
+                    break
+                batch.append(item)
+            await self._dispatch(batch)
+            if closing:
+                return
+
+    async def _dispatch(
+        self, batch: list[tuple[SMSSendRequest, asyncio.Future[SMSMessage]]]
+    ) -> None:
+        try:
+            results = await self._flush([request for request, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
 
 
 class SMS:
@@ -16,14 +113,20 @@ class SMS:
     def __init__(self, client: HttpClient, config: SMSConfig) -> None:
         self._client = client
         self._config = config
+        self._batcher: Optional[_SMSBatcher] = None
 
     async def send(self, request: SMSSendRequest) -> SMSMessage:
         """Send a single SMS message."""
-        to = request.to[0] if isinstance(request.to, list) else request.to
+        return await self._send_to(_recipient(request), request)
+
+    async def _send_to(
+        self, to: str, request: SMSSendRequest | SMSBulkSendRequest
+    ) -> SMSMessage:
         if not to:
             raise ValueError("SMS recipient (to) is required")
 
-        message_id = f"sms_{int(datetime.now().timestamp() * 1000)}"
+        now_iso = datetime.now().isoformat()
+        message_id = f"sms_{time_ns() // 1_000_000}"
         normalized_to = self._normalize_phone_number(to)
 
         # Provider-specific logic would go here
@@ -38,33 +141,86 @@ class SMS:
             provider=self._config.provider,
             parts=(len(request.body) + 159) // 160,
             metadata=request.metadata,
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=now_iso,
+            updated_at=now_iso,
         )
 
-    async def send_bulk(self, request: SMSSendRequest) -> SMSBulkResult:
+    async def send_bulk(
+        self, request: SMSBulkSendRequest | SMSSendRequest
+    ) -> SMSBulkResult:
         """Send SMS to multiple recipients."""
         recipients = request.to if isinstance(request.to, list) else [request.to]
         successful: list[SMSMessage] = []
-        failed: list[dict] = []
-
-        for to in recipients:
-            try:
-                message = await self.send(SMSSendRequest(
-                    to=to,
-                    body=request.body,
-                    from_=request.from_,
-                    callback_url=request.callback_url,
-                    metadata=request.metadata,
-                ))
-                successful.append(message)
-            except Exception as e:
-                failed.append({"to": to, "error": str(e)})
+        failed: list[SMSFailure] = []
+
+        # Every recipient shares the one request; no per-recipient copies
+        results = await self._send_many([(to, request) for to in recipients])
+        for to, result in zip(recipients, results):
+            if isinstance(result, Exception):
+                failed.append(SMSFailure(to=to, error=str(result)))
+            else:
+                successful.append(result)
 
         return SMSBulkResult(successful=successful, failed=failed)
 
+    def send_buffered(self, request: SMSSendRequest) -> asyncio.Future[SMSMessage]:
+        """
+        Queue a message to be sent with others in a batch.
+
+        Messages are flushed once ``buffer_size`` are queued or
+        ``buffer_window`` seconds after the first one, trading a little latency
+        for fewer provider calls when sending one message at a time.
+        Await the returned future for the sent message. Call :meth:`aclose`
+        before shutting down to flush anything still queued.
+        """
+        if self._batcher is None:
+            self._batcher = _SMSBatcher(
+                self._flush_buffered, self._config.buffer_size, self._config.buffer_window
+            )
+        return self._batcher.submit(request)
+
+    async def aclose(self) -> None:
+        """Flush messages queued with :meth:`send_buffered`."""
+        if self._batcher is not None:
+            await self._batcher.aclose()
+
+    async def _flush_buffered(
+        self, requests: list[SMSSendRequest]
+    ) -> list[SMSMessage | Exception]:
+        return await self._send_many([(_recipient(r), r) for r in requests])
+
+    async def _send_many(
+        self, messages: list[tuple[str, SMSSendRequest | SMSBulkSendRequest]]
+    ) -> list[SMSMessage | Exception]:
+        """Send messages concurrently, returning a message or exception for each.
+
+        Requests are dispatched in chunks of ``batch_size`` with at most
+        ``max_concurrency`` in flight, so large recipient lists neither run
+        serially nor open an unbounded number of connections.
+        """
+        semaphore = asyncio.Semaphore(max(1, self._config.max_concurrency))
+        batch_size = max(1, self._config.batch_size)
+
+        async def send_one(
+            to: str, request: SMSSendRequest | SMSBulkSendRequest
+        ) -> SMSMessage:
+            async with semaphore:
+                return await self._send_to(to, request)
+
+        results: list[SMSMessage | Exception] = []
+        for start in range(0, len(messages), batch_size):
+            batch = messages[start:start + batch_size]
+            for result in await asyncio.gather(
+                *(send_one(to, r) for to, r in batch), return_exceptions=True
+            ):
+                if isinstance(result, BaseException) and not isinstance(result, Exception):
+                    raise result
+                results.append(result)
+        return results
+
     async def get_status(self, message_id: str) -> SMSMessage:
         """Get SMS delivery status."""
+        now_iso = datetime.now().isoformat()
         return SMSMessage(
             id=message_id,
             to="",
@@ -72,8 +228,8 @@ class SMS:
             status="delivered",
             direction="outbound",
             provider=self._config.provider,
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=now_iso,
+            updated_at=now_iso,
         )
 
     async def get_balance(self) -> dict:
@@ -82,7 +238,14 @@ class SMS:
 
     def _normalize_phone_number(self, phone: str) -> str:
         """Normalize South African phone numbers to E.164 format."""
-        digits = re.sub(r"\D", "", phone)
+        # Most numbers already arrive as +27XXXXXXXXX
+        if len(phone) == 12 and phone[0] == "+" and phone[1:].isdecimal():
+            return phone
+
+        if phone.isascii():
+            digits = phone.translate(_STRIP_NON_DIGITS)
+        else:
+            digits = _NON_DIGITS.sub("", phone)
 
         # Handle SA numbers
         if digits.startswith("0") and len(digits) == 10:
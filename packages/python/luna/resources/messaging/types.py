@@ -17,7 +17,7 @@ MessageStatus = Literal["pending", "sent", "delivered", "read", "failed"]
 USSDState = Literal["new", "active", "completed", "timeout"]
 
 
-@dataclass
+@dataclass(slots=True)
 class SMSConfig:
     """SMS configuration."""
     provider: SMSProvider
@@ -25,9 +25,13 @@ class SMSConfig:
     username: Optional[str] = None
     sender_id: Optional[str] = None
     sandbox: bool = False
+    max_concurrency: int = 10
+    batch_size: int = 100
+    buffer_size: int = 10
+    buffer_window: float = 0.2
 
 
-@dataclass
+@dataclass(slots=True)
 class WhatsAppConfig:
     """WhatsApp configuration."""
     provider: WhatsAppProvider
@@ -37,7 +41,7 @@ class WhatsAppConfig:
     sandbox: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class USSDConfig:
     """USSD configuration."""
     provider: USSDProvider
@@ -46,7 +50,7 @@ class USSDConfig:
     sandbox: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class MessagingConfig:
     """Combined messaging configuration."""
     sms: Optional[SMSConfig] = None
@@ -54,7 +58,7 @@ class MessagingConfig:
     ussd: Optional[USSDConfig] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SMSSendRequest:
     """SMS send request."""
     to: str | list[str]
@@ -64,7 +68,17 @@ class SMSSendRequest:
     metadata: Optional[dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
+class SMSBulkSendRequest:
+    """SMS bulk send request: one body sent to many recipients."""
+    to: list[str]
+    body: str
+    from_: Optional[str] = None
+    callback_url: Optional[str] = None
+    metadata: Optional[dict] = None
+
+
+@dataclass(slots=True)
 class SMSMessage:
     """SMS message response."""
     id: str
@@ -80,21 +94,28 @@ class SMSMessage:
     updated_at: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
+class SMSFailure:
+    """Recipient that could not be sent to in a bulk send."""
+    to: str
+    error: str
+
+
+@dataclass(slots=True)
 class SMSBulkResult:
     """SMS bulk send result."""
     successful: list[SMSMessage] = field(default_factory=list)
-    failed: list[dict] = field(default_factory=list)
+    failed: list[SMSFailure] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class WhatsAppTextRequest:
     """WhatsApp text message request."""
     to: str
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WhatsAppTemplateRequest:
     """WhatsApp template message request."""
     to: str
@@ -103,7 +124,7 @@ class WhatsAppTemplateRequest:
     language: str = "en"
 
 
-@dataclass
+@dataclass(slots=True)
 class WhatsAppMediaRequest:
     """WhatsApp media message request."""
     to: str
@@ -112,7 +133,7 @@ class WhatsAppMediaRequest:
     caption: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WhatsAppMessage:
     """WhatsApp message response."""
     id: str
@@ -130,7 +151,7 @@ class WhatsAppMessage:
     updated_at: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class USSDSession:
     """USSD session data."""
     id: str
@@ -144,7 +165,7 @@ class USSDSession:
     updated_at: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class USSDResponse:
     """USSD response."""
     text: str
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Callable, Awaitable, Optional
+import inspect
+from datetime import datetime
+from time import time_ns
+from typing import Callable, Awaitable, Optional, Sequence, cast
 
 from luna.http import HttpClient
 from .types import USSDConfig, USSDSession, USSDResponse
@@ -10,6 +13,48 @@ from .types import USSDConfig, USSDSession, USSDResponse
 # Handler type
 USSDHandler = Callable[[USSDSession], Awaitable[USSDResponse] | USSDResponse]
 
+# Registered handlers are stored as coroutine functions, so dispatch never has
+# to inspect what a handler returned
+_AsyncHandler = Callable[[USSDSession], Awaitable[USSDResponse]]
+
+# Africa's Talking network codes
+_AT_NETWORKS = {
+    "655001": "Vodacom",
+    "655002": "Telkom",
+    "655007": "Cell C",
+    "655010": "MTN",
+}
+
+
+_EXAMPLE_MENU = (
+    ("1", "Check Balance"),
+    ("2", "Send Payment"),
+    ("3", "Mini Statement"),
+    ("4", "Exit"),
+)
+
+
+def _as_async(handler: USSDHandler) -> _AsyncHandler:
+    """Return ``handler`` as a coroutine function, wrapping it if it is sync."""
+    if inspect.iscoroutinefunction(handler):
+        return handler
+    sync_handler = cast(Callable[[USSDSession], USSDResponse], handler)
+
+    async def call(session: USSDSession) -> USSDResponse:
+        return sync_handler(session)
+
+    return call
+
+
+class _MenuNode:
+    """Node in the trie of registered menu paths, keyed by ``*`` segment."""
+
+    __slots__ = ("children", "handler")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _MenuNode] = {}
+        self.handler: Optional[_AsyncHandler] = None
+
 
 class USSD:
     """USSD service integration for South African networks."""
@@ -17,19 +62,51 @@ class USSD:
     def __init__(self, client: HttpClient, config: USSDConfig) -> None:
         self._client = client
         self._config = config
-        self._handlers: dict[str, USSDHandler] = {}
+        self._menus = _MenuNode()
+        self._default: Optional[_AsyncHandler] = None
 
     def on_session(self, handler: USSDHandler) -> None:
-        """Register a handler for USSD sessions."""
-        self._handlers["default"] = handler
+        """
+        Register a handler for USSD sessions.
+
+        Handlers are either coroutine functions or plain functions returning
+        a :class:`USSDResponse`; use ``async def`` rather than a sync callable
+        that returns an awaitable.
+        """
+        self._default = _as_async(handler)
 
     def on_menu(self, path: str, handler: USSDHandler) -> None:
-        """Register a handler for a specific menu path."""
-        self._handlers[path] = handler
+        """
+        Register a handler for a menu path such as ``"1*2"``.
+
+        Input below a registered path (``"1*2*5"``) is dispatched to the
+        handler of its longest registered prefix.
+        """
+        node = self._menus
+        if path:
+            for segment in path.split("*"):
+                node = node.children.setdefault(segment, _MenuNode())
+        node.handler = _as_async(handler)
+
+    def _resolve(self, text: str) -> Optional[_AsyncHandler]:
+        node = self._menus
+        # A handler registered for "" only answers the initial dial; the
+        # on_session handler stays the catch-all for unmatched input
+        if not text:
+            return node.handler or self._default
+        handler = None
+        for segment in text.split("*"):
+            child = node.children.get(segment)
+            if child is None:
+                break
+            node = child
+            if node.handler is not None:
+                handler = node.handler
+        return handler or self._default
 
     async def process_request(self, session: USSDSession) -> USSDResponse:
         """Process incoming USSD request."""
-        handler = self._handlers.get(session.text) or self._handlers.get("default")
+        handler = self._resolve(session.text)
 
         if not handler:
             return USSDResponse(
@@ -38,10 +115,7 @@ class USSD:
             )
 
         try:
-            result = handler(session)
-            if hasattr(result, "__await__"):
-                return await result
-            return result
+            return await handler(session)
         except Exception as e:
             print(f"USSD handler error: {e}")
             return USSDResponse(
@@ -50,12 +124,25 @@ class USSD:
             )
 
     @staticmethod
-    def menu(title: str, options: list[dict[str, str]]) -> str:
-        """Create a menu response."""
-        lines = [title, ""]
-        for option in options:
-            lines.append(f"{option['key']}. {option['label']}")
-        return "\n".join(lines)
+    def menu(
+        title: str,
+        options: Sequence[tuple[str, str]] | Sequence[dict[str, str]],
+    ) -> str:
+        """
+        Create a menu response.
+
+        Options are ``(key, label)`` tuples, or dicts with ``key`` and
+        ``label`` entries.
+        """
+        return "\n".join((
+            title,
+            "",
+            *(
+                f"{option[0]}. {option[1]}" if isinstance(option, tuple)
+                else f"{option['key']}. {option['label']}"
+                for option in options
+            ),
+        ))
 
     def parse_africastalking_request(
         self,
@@ -66,25 +153,18 @@ class USSD:
         network_code: Optional[str] = None,
     ) -> USSDSession:
         """Parse Africa's Talking webhook format."""
-        from datetime import datetime
-
-        networks = {
-            "655001": "Vodacom",
-            "655002": "Telkom",
-            "655007": "Cell C",
-            "655010": "MTN",
-        }
+        now_iso = datetime.now().isoformat()
 
         return USSDSession(
-            id=f"ussd_{int(datetime.now().timestamp() * 1000)}",
+            id=f"ussd_{time_ns() // 1_000_000}",
             session_id=session_id,
             phone_number=phone_number,
             service_code=service_code,
             text=text,
             state="active",
-            network=networks.get(network_code or "", network_code),
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            network=_AT_NETWORKS.get(network_code or "", network_code),
+            created_at=now_iso,
+            updated_at=now_iso,
         )
 
     def format_africastalking_response(self, response: USSDResponse) -> str:
@@ -100,17 +180,16 @@ class USSD:
         shortcode: str,
     ) -> USSDSession:
         """Parse Clickatell webhook format."""
-        from datetime import datetime
-
+        now_iso = datetime.now().isoformat()
         return USSDSession(
-            id=f"ussd_{int(datetime.now().timestamp() * 1000)}",
+            id=f"ussd_{time_ns() // 1_000_000}",
             session_id=session_id,
             phone_number=msisdn,
             service_code=shortcode,
             text=request,
             state="active",
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=now_iso,
+            updated_at=now_iso,
         )
 
     @property
@@ -126,12 +205,7 @@ class USSD:
 
             if not parts:
                 return USSDResponse(
-                    text=USSD.menu("Welcome to Luna SDK", [
-                        {"key": "1", "label": "Check Balance"},
-                        {"key": "2", "label": "Send Payment"},
-                        {"key": "3", "label": "Mini Statement"},
-                        {"key": "4", "label": "Exit"},
-                    ]),
+                    text=USSD.menu("Welcome to Luna SDK", _EXAMPLE_MENU),
                     end=False,
                 )
 
@@ -4,10 +4,18 @@ from __future__ import annotations
 
 import hashlib
 import hmac
+import json
 import re
+from collections import OrderedDict
 from datetime import datetime
+from time import time_ns
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 from luna.http import HttpClient
 from .types import (
     WhatsAppConfig,
@@ -15,8 +23,33 @@ from .types import (
     WhatsAppTemplateRequest,
     WhatsAppMediaRequest,
     WhatsAppMessage,
+    MessageStatus,
 )
 
+# Number of recent successful webhook verifications to remember
+_VERIFY_CACHE_SIZE = 1024
+
+# Cloud API delivery statuses; anything else is reported as pending. Values are
+# interned literals, so messages share one object per status.
+_STATUS_MAP: dict[str, MessageStatus] = {
+    "sent": "sent",
+    "delivered": "delivered",
+    "read": "read",
+    "failed": "failed",
+}
+
+# Canonical objects for known inbound message types; unknown types pass through
+_MESSAGE_TYPES = {
+    t: t for t in ("text", "template", "image", "document", "audio", "video")
+}
+
+# Strips every ASCII non-digit; non-ASCII input falls back to the regex so
+# Unicode digits are handled exactly as before
+_NON_DIGITS = re.compile(r"\D")
+_STRIP_NON_DIGITS = str.maketrans("", "", "".join(
+    chr(c) for c in range(128) if not chr(c).isdigit()
+))
+
 
 class WhatsApp:
     """WhatsApp Business API integration."""
@@ -24,10 +57,14 @@ class WhatsApp:
     def __init__(self, client: HttpClient, config: WhatsAppConfig) -> None:
         self._client = client
         self._config = config
+        self._hmac_token: str | None = None
+        self._hmac_key: bytes | None = None
+        self._verified: OrderedDict[tuple[bytes, str], None] = OrderedDict()
 
     async def send_text(self, request: WhatsAppTextRequest) -> WhatsAppMessage:
         """Send a text message."""
-        message_id = f"wa_{int(datetime.now().timestamp() * 1000)}"
+        now_iso = datetime.now().isoformat()
+        message_id = f"wa_{time_ns() // 1_000_000}"
         to = self._normalize_phone_number(request.to)
 
         return WhatsAppMessage(
@@ -38,13 +75,14 @@ class WhatsApp:
             status="pending",
             direction="outbound",
             provider=self._config.provider,
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=now_iso,
+            updated_at=now_iso,
         )
 
     async def send_template(self, request: WhatsAppTemplateRequest) -> WhatsAppMessage:
         """Send a template message."""
-        message_id = f"wa_{int(datetime.now().timestamp() * 1000)}"
+        now_iso = datetime.now().isoformat()
+        message_id = f"wa_{time_ns() // 1_000_000}"
         to = self._normalize_phone_number(request.to)
 
         return WhatsAppMessage(
@@ -56,13 +94,14 @@ class WhatsApp:
             status="pending",
             direction="outbound",
             provider=self._config.provider,
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=now_iso,
+            updated_at=now_iso,
         )
 
     async def send_media(self, request: WhatsAppMediaRequest) -> WhatsAppMessage:
         """Send a media message."""
-        message_id = f"wa_{int(datetime.now().timestamp() * 1000)}"
+        now_iso = datetime.now().isoformat()
+        message_id = f"wa_{time_ns() // 1_000_000}"
         to = self._normalize_phone_number(request.to)
 
         return WhatsAppMessage(
@@ -73,12 +112,13 @@ class WhatsApp:
             status="pending",
             direction="outbound",
             provider=self._config.provider,
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=now_iso,
+            updated_at=now_iso,
         )
 
     async def get_status(self, message_id: str) -> WhatsAppMessage:
         """Get message status."""
+        now_iso = datetime.now().isoformat()
         return WhatsAppMessage(
             id=message_id,
             to="",
@@ -86,70 +126,137 @@ class WhatsApp:
             status="delivered",
             direction="outbound",
             provider=self._config.provider,
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=now_iso,
+            updated_at=now_iso,
         )
 
-    def verify_webhook(self, payload: str, signature: str) -> bool:
-        """Verify webhook signature (Cloud API)."""
-        if not self._config.webhook_token:
+    def verify_webhook(self, payload: str | bytes, signature: str) -> bool:
+        """Verify webhook signature (Cloud API).
+
+        Pass the raw request body as bytes to avoid re-encoding it.
+        """
+        key = self._webhook_key()
+        if key is None:
             raise ValueError("Webhook token not configured")
 
-        expected_signature = hmac.new(
-            self._config.webhook_token.encode(),
-            payload.encode(),
-            hashlib.sha256,
-        ).hexdigest()
+        if not signature.startswith("sha256="):
+            return False
+        try:
+            received = bytes.fromhex(signature[7:])
+        except ValueError:
+            return False
+
+        if isinstance(payload, str):
+            payload = payload.encode()
+
+        # Providers retry deliveries, so remember recent successes; failures
+        # are not cached so bad signatures cannot evict genuine entries.
+        # BLAKE2b is a single cheap pass, unlike the two SHA-256 passes of
+        # the HMAC.
+        cache_key = (hashlib.blake2b(payload, digest_size=16).digest(), signature)
+        if cache_key in self._verified:
+            self._verified.move_to_end(cache_key)
+            return True
 
-        return f"sha256={expected_signature}" == signature
+        expected = hmac.new(key, payload, hashlib.sha256).digest()
+        if not hmac.compare_digest(expected, received):
+            return False
+        self._verified[cache_key] = None
+        if len(self._verified) > _VERIFY_CACHE_SIZE:
+            self._verified.popitem(last=False)
+        return True
+
+    def update_webhook_token(self, webhook_token: str) -> None:
+        """Rotate the webhook token used to verify signatures."""
+        self._config.webhook_token = webhook_token
+
+    def _webhook_key(self) -> bytes | None:
+        """Return the HMAC key, re-deriving it if the configured token changed."""
+        token = self._config.webhook_token
+        if token != self._hmac_token:
+            self._hmac_token = token
+            self._hmac_key = token.encode() if token else None
+            self._verified.clear()
+        return self._hmac_key
+
+    def process_webhook_bytes(
+        self, raw: bytes, signature: str | None = None
+    ) -> list[WhatsAppMessage]:
+        """
+        Process a raw webhook request body.
+
+        When ``signature`` is given it is verified against ``raw`` first.
+        The body is parsed with orjson when it is installed.
+
+        Raises:
+            ValueError: If the signature does not match
+        """
+        if signature is not None and not self.verify_webhook(raw, signature):
+            raise ValueError("Invalid webhook signature")
+        payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        return self.process_webhook(payload)
 
     def process_webhook(self, payload: dict[str, Any]) -> list[WhatsAppMessage]:
         """Process incoming webhook."""
         messages: list[WhatsAppMessage] = []
+        now_iso = datetime.now().isoformat()
+        provider = self._config.provider
+
+        # Messages in one delivery usually share a handful of timestamps
+        timestamps: dict[int, str] = {}
+
+        def iso(ts: int) -> str:
+            formatted = timestamps.get(ts)
+            if formatted is None:
+                formatted = timestamps[ts] = datetime.fromtimestamp(ts).isoformat()
+            return formatted
 
         for entry in payload.get("entry", []):
             for change in entry.get("changes", []):
                 value = change.get("value", {})
+                phone_number_id = value.get("metadata", {}).get("phone_number_id", "")
 
                 # Process incoming messages
                 for msg in value.get("messages", []):
+                    msg_type = msg.get("type", "text")
                     messages.append(WhatsAppMessage(
                         id=msg.get("id", ""),
-                        to=value.get("metadata", {}).get("phone_number_id", ""),
+                        to=phone_number_id,
                         from_=msg.get("from"),
-                        type=msg.get("type", "text"),
+                        type=_MESSAGE_TYPES.get(msg_type, msg_type),
                         text=msg.get("text", {}).get("body"),
                         status="delivered",
                         direction="inbound",
-                        provider=self._config.provider,
-                        created_at=datetime.fromtimestamp(int(msg.get("timestamp", 0))).isoformat(),
-                        updated_at=datetime.now().isoformat(),
+                        provider=provider,
+                        created_at=iso(int(msg.get("timestamp", 0))),
+                        updated_at=now_iso,
                     ))
 
                 # Process status updates
                 for status in value.get("statuses", []):
-                    status_map = {
-                        "sent": "sent",
-                        "delivered": "delivered",
-                        "read": "read",
-                        "failed": "failed",
-                    }
                     messages.append(WhatsAppMessage(
                         id=status.get("id", ""),
                         to="",
                         type="text",
-                        status=status_map.get(status.get("status", ""), "pending"),
+                        status=_STATUS_MAP.get(status.get("status", ""), "pending"),
                         direction="outbound",
-                        provider=self._config.provider,
-                        created_at=datetime.fromtimestamp(int(status.get("timestamp", 0))).isoformat(),
-                        updated_at=datetime.now().isoformat(),
+                        provider=provider,
+                        created_at=iso(int(status.get("timestamp", 0))),
+                        updated_at=now_iso,
                     ))
 
         return messages
 
     def _normalize_phone_number(self, phone: str) -> str:
         """Normalize phone number for WhatsApp (E.164 without +)."""
-        digits = re.sub(r"\D", "", phone)
+        # Most numbers already arrive as +27XXXXXXXXX
+        if len(phone) == 12 and phone[0] == "+" and phone[1:].isdecimal():
+            return phone[1:]
+
+        if phone.isascii():
+            digits = phone.translate(_STRIP_NON_DIGITS)
+        else:
+            digits = _NON_DIGITS.sub("", phone)
 
         if digits.startswith("0") and len(digits) == 10:
             digits = "27" + digits[1:]
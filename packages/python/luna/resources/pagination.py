@@ -2,32 +2,46 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TypeVar, AsyncIterator, Callable, Awaitable
 from luna.types import ListResponse
 
 T = TypeVar("T")
 
+_DONE = object()
+
 class Paginator(AsyncIterator[T]):
     """
     Async iterator for auto-pagination.
     
     Yields individual items from pages, fetching new pages as needed.
+    Iteration stops after ``max_items`` items, if given, without fetching
+    any further pages.
     """
     
     def __init__(
         self,
         fetch_next: Callable[[str | None], Awaitable[ListResponse]],
+        max_items: int | None = None,
     ) -> None:
         self._fetch_next = fetch_next
         self._buffer: list[T] = []
         self._next_cursor: str | None = None
         self._has_more = True
         self._initialized = False
+        self._remaining = max_items
 
     def __aiter__(self) -> AsyncIterator[T]:
         return self
 
     async def __anext__(self) -> T:
+        if self._remaining is not None:
+            if self._remaining <= 0:
+                raise StopAsyncIteration
+            self._remaining -= 1
+        return await self._next_item()
+
+    async def _next_item(self) -> T:
         if self._buffer:
             return self._buffer.pop(0)
 
@@ -45,3 +59,39 @@ class Paginator(AsyncIterator[T]):
             raise StopAsyncIteration
             
         return self._buffer.pop(0)
+
+
+async def prefetched(iterator: AsyncIterator[T], depth: int = 2) -> AsyncIterator[T]:
+    """
+    Read ahead of the consumer of an async iterator.
+
+    A background task pulls up to ``depth`` items into a queue, so the next
+    page request is already in flight while the caller is still processing
+    the current items. Use the page size as ``depth`` to overlap whole pages.
+
+    Example:
+        async for user in prefetched(client.users.iterate(limit=10), depth=10):
+            ...
+    """
+    queue: asyncio.Queue[object] = asyncio.Queue(maxsize=depth)
+
+    async def produce() -> None:
+        try:
+            async for item in iterator:
+                await queue.put(item)
+        except Exception as error:
+            await queue.put(error)
+        else:
+            await queue.put(_DONE)
+
+    task = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item  # type: ignore[misc]
+    finally:
+        task.cancel()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Optional
 
 from luna.http import HttpClient
@@ -93,66 +94,55 @@ class Payments:
     def __init__(self, client: HttpClient, config: Optional[PaymentsConfig] = None) -> None:
         self._client = client
         self._config = config or PaymentsConfig()
+        self._available = tuple(
+            name
+            for name, provider_config in (
+                ("payfast", self._config.payfast),
+                ("ozow", self._config.ozow),
+                ("yoco", self._config.yoco),
+                ("payshap", self._config.payshap),
+            )
+            if provider_config
+        )
 
-        # Lazy-initialized providers
-        self._payfast: Optional[PayFast] = None
-        self._ozow: Optional[Ozow] = None
-        self._yoco: Optional[Yoco] = None
-        self._payshap: Optional[PayShap] = None
+    # Providers are created on first access and cached on the instance
 
-    @property
+    @cached_property
     def payfast(self) -> PayFast:
         """Get PayFast gateway instance."""
-        if not self._payfast:
-            if not self._config.payfast:
-                raise ValueError(
-                    "PayFast not configured. Provide PayFastConfig when initializing LunaClient."
-                )
-            self._payfast = PayFast(self._client, self._config.payfast)
-        return self._payfast
-
-    @property
+        if not self._config.payfast:
+            raise ValueError(
+                "PayFast not configured. Provide PayFastConfig when initializing LunaClient."
+            )
+        return PayFast(self._client, self._config.payfast)
+
+    @cached_property
     def ozow(self) -> Ozow:
         """Get Ozow gateway instance."""
-        if not self._ozow:
-            if not self._config.ozow:
-                raise ValueError(
-                    "Ozow not configured. Provide OzowConfig when initializing LunaClient."
-                )
-            self._ozow = Ozow(self._client, self._config.ozow)
-        return self._ozow
-
-    @property
+        if not self._config.ozow:
+            raise ValueError(
+                "Ozow not configured. Provide OzowConfig when initializing LunaClient."
+            )
+        return Ozow(self._client, self._config.ozow)
+
+    @cached_property
     def yoco(self) -> Yoco:
         """Get Yoco gateway instance."""
-        if not self._yoco:
-            if not self._config.yoco:
-                raise ValueError(
-                    "Yoco not configured. Provide YocoConfig when initializing LunaClient."
-                )
-            self._yoco = Yoco(self._client, self._config.yoco)
-        return self._yoco
-
-    @property
+        if not self._config.yoco:
+            raise ValueError(
+                "Yoco not configured. Provide YocoConfig when initializing LunaClient."
+            )
+        return Yoco(self._client, self._config.yoco)
+
+    @cached_property
     def payshap(self) -> PayShap:
         """Get PayShap gateway instance."""
-        if not self._payshap:
-            if not self._config.payshap:
-                raise ValueError(
-                    "PayShap not configured. Provide PayShapConfig when initializing LunaClient."
-                )
-            self._payshap = PayShap(self._client, self._config.payshap)
-        return self._payshap
+        if not self._config.payshap:
+            raise ValueError(
+                "PayShap not configured. Provide PayShapConfig when initializing LunaClient."
+            )
+        return PayShap(self._client, self._config.payshap)
 
     def list(self) -> list[str]:
         """List available payment gateways."""
-        available = []
-        if self._config.payfast:
-            available.append("payfast")
-        if self._config.ozow:
-            available.append("ozow")
-        if self._config.yoco:
-            available.append("yoco")
-        if self._config.payshap:
-            available.append("payshap")
-        return available
+        return list(self._available)
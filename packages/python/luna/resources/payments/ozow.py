@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import hashlib
 from datetime import datetime
+from time import time_ns
 from typing import Any
-from urllib.parse import urlencode
+from urllib.parse import quote_plus
 
 from luna.http import HttpClient
 from .types import (
@@ -15,10 +16,27 @@ from .types import (
     RefundRequest,
     Refund,
     Amount,
+    PaymentStatus,
 )
 
 OZOW_PAYMENT_URL = "https://pay.ozow.com"
 
+# Ozow notification Status values, mapped to payment statuses
+_STATUS_MAP: dict[str, PaymentStatus] = {
+    "Complete": "completed",
+    "Cancelled": "cancelled",
+    "Error": "failed",
+    "Abandoned": "cancelled",
+    "PendingInvestigation": "processing",
+}
+
+# Fields that make up the hash check, in the order Ozow concatenates them
+_HASH_FIELDS = (
+    "SiteCode", "CountryCode", "CurrencyCode", "Amount",
+    "TransactionReference", "BankReference", "CancelUrl",
+    "ErrorUrl", "SuccessUrl", "NotifyUrl", "IsTest",
+)
+
 
 class Ozow:
     """Ozow instant EFT payment integration."""
@@ -26,10 +44,12 @@ class Ozow:
     def __init__(self, client: HttpClient, config: OzowConfig) -> None:
         self._client = client
         self._config = config
+        self._private_key_bytes = config.private_key.lower().encode()
 
     async def create_payment(self, request: OzowPaymentRequest) -> OzowPayment:
         """Create a payment request and get redirect URL."""
-        payment_id = f"oz_{int(datetime.now().timestamp() * 1000)}"
+        payment_id = f"oz_{time_ns() // 1_000_000}"
+        now_iso = datetime.now().isoformat()
 
         data: dict[str, str] = {
             "SiteCode": self._config.site_code,
@@ -45,20 +65,22 @@ class Ozow:
             "IsTest": "true" if (request.is_test or self._config.sandbox) else "false",
         }
 
-        if request.customer_first_name:
-            data["CustomerFirstName"] = request.customer_first_name
-        if request.customer_last_name:
-            data["CustomerLastName"] = request.customer_last_name
-        if request.customer_email:
-            data["CustomerEmail"] = request.customer_email
-        if request.customer_phone:
-            data["CustomerPhone"] = request.customer_phone
+        for key, value in (
+            ("CustomerFirstName", request.customer_first_name),
+            ("CustomerLastName", request.customer_last_name),
+            ("CustomerEmail", request.customer_email),
+            ("CustomerPhone", request.customer_phone),
+        ):
+            if value:
+                data[key] = value
 
         hash_string = self._generate_hash_string(data)
         hash_check = self._generate_hash(hash_string)
         data["HashCheck"] = hash_check
 
-        payment_url = f"{OZOW_PAYMENT_URL}?{urlencode(data)}"
+        # Keys are plain identifiers, so only the values need quoting
+        query = "&".join([f"{key}={quote_plus(value)}" for key, value in data.items()])
+        payment_url = f"{OZOW_PAYMENT_URL}?{query}"
 
         return OzowPayment(
             id=payment_id,
@@ -69,8 +91,8 @@ class Ozow:
             description=request.bank_reference,
             payment_url=payment_url,
             transaction_id=payment_id,
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=now_iso,
+            updated_at=now_iso,
         )
 
     def verify_webhook(self, payload: dict[str, Any]) -> bool:
@@ -82,14 +104,7 @@ class Ozow:
 
     def process_webhook(self, payload: dict[str, Any]) -> OzowPayment:
         """Process webhook and return payment status."""
-        status_map = {
-            "Complete": "completed",
-            "Cancelled": "cancelled",
-            "Error": "failed",
-            "Abandoned": "cancelled",
-            "PendingInvestigation": "processing",
-        }
-
+        now_iso = datetime.now().isoformat()
         return OzowPayment(
             id=payload.get("TransactionReference", ""),
             provider="ozow",
@@ -98,16 +113,17 @@ class Ozow:
                 value=int(float(payload.get("Amount", 0)) * 100),
                 currency="ZAR",
             ),
-            status=status_map.get(payload.get("Status", ""), "pending"),
+            status=_STATUS_MAP.get(payload.get("Status", ""), "pending"),
             reference=payload.get("TransactionReference"),
             payment_url="",
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=now_iso,
+            updated_at=now_iso,
         )
 
     async def refund(self, request: RefundRequest) -> Refund:
         """Request a refund."""
-        refund_id = f"ref_{int(datetime.now().timestamp() * 1000)}"
+        refund_id = f"ref_{time_ns() // 1_000_000}"
+        now_iso = datetime.now().isoformat()
 
         return Refund(
             id=refund_id,
@@ -115,19 +131,15 @@ class Ozow:
             amount=Amount(value=request.amount or 0, currency="ZAR"),
             status="pending",
             reason=request.reason,
-            created_at=datetime.now().isoformat(),
+            created_at=now_iso,
         )
 
     def _generate_hash_string(self, data: dict[str, str]) -> str:
         """Generate hash string for Ozow."""
-        ordered_fields = [
-            "SiteCode", "CountryCode", "CurrencyCode", "Amount",
-            "TransactionReference", "BankReference", "CancelUrl",
-            "ErrorUrl", "SuccessUrl", "NotifyUrl", "IsTest",
-        ]
-        return "".join(data.get(field, "") for field in ordered_fields).lower()
+        return "".join([data.get(field, "") for field in _HASH_FIELDS]).lower()
 
     def _generate_hash(self, input_string: str) -> str:
         """Generate SHA512 hash."""
-        to_hash = input_string + self._config.private_key.lower()
-        return hashlib.sha512(to_hash.encode()).hexdigest()
+        digest = hashlib.sha512(input_string.encode())
+        digest.update(self._private_key_bytes)
+        return digest.hexdigest()
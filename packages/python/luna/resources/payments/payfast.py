@@ -5,8 +5,9 @@ from __future__ import annotations
 import hashlib
 import hmac
 from datetime import datetime
+from time import time_ns
 from typing import Any
-from urllib.parse import urlencode
+from urllib.parse import quote_plus
 
 from luna.http import HttpClient
 from .types import (
@@ -16,11 +17,28 @@ from .types import (
     RefundRequest,
     Refund,
     Amount,
+    PaymentStatus,
 )
 
 PAYFAST_LIVE_URL = "https://www.payfast.co.za/eng/process"
 PAYFAST_SANDBOX_URL = "https://sandbox.payfast.co.za/eng/process"
 
+# PayFast ITN payment_status values, mapped to payment statuses
+_STATUS_MAP: dict[str, PaymentStatus] = {
+    "COMPLETE": "completed",
+    "FAILED": "failed",
+    "PENDING": "pending",
+    "CANCELLED": "cancelled",
+}
+
+# Every field create_payment can send, pre-sorted for signing
+_PAYMENT_FIELDS = tuple(sorted((
+    "merchant_id", "merchant_key", "return_url", "cancel_url", "notify_url",
+    "m_payment_id", "amount", "item_name", "item_description",
+    "email_address", "cell_number", "custom_str1", "custom_str2",
+    "custom_str3", "custom_int1", "custom_int2", "payment_method",
+)))
+
 
 class PayFast:
     """PayFast payment gateway integration."""
@@ -28,10 +46,14 @@ class PayFast:
     def __init__(self, client: HttpClient, config: PayFastConfig) -> None:
         self._client = client
         self._config = config
+        self._passphrase_suffix = (
+            f"&passphrase={config.passphrase}".encode() if config.passphrase else b""
+        )
 
     async def create_payment(self, request: PayFastPaymentRequest) -> PayFastPayment:
         """Create a payment request and get redirect URL."""
-        payment_id = f"pf_{int(datetime.now().timestamp() * 1000)}"
+        payment_id = f"pf_{time_ns() // 1_000_000}"
+        now_iso = datetime.now().isoformat()
 
         data: dict[str, str] = {
             "merchant_id": self._config.merchant_id,
@@ -63,11 +85,13 @@ class PayFast:
         if request.payment_method:
             data["payment_method"] = request.payment_method
 
-        signature = self._generate_signature(data)
+        signature = self._generate_signature(data, _PAYMENT_FIELDS)
         data["signature"] = signature
 
         base_url = PAYFAST_SANDBOX_URL if self._config.sandbox else PAYFAST_LIVE_URL
-        payment_url = f"{base_url}?{urlencode(data)}"
+        # Keys are plain identifiers, so only the values need quoting
+        query = "&".join([f"{key}={quote_plus(value)}" for key, value in data.items()])
+        payment_url = f"{base_url}?{query}"
 
         return PayFastPayment(
             id=payment_id,
@@ -78,8 +102,8 @@ class PayFast:
             description=request.item_description,
             payment_url=payment_url,
             signature=signature,
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=now_iso,
+            updated_at=now_iso,
         )
 
     def verify_webhook(self, payload: dict[str, Any]) -> bool:
@@ -90,13 +114,7 @@ class PayFast:
 
     def process_webhook(self, payload: dict[str, Any]) -> PayFastPayment:
         """Process webhook and return payment status."""
-        status_map = {
-            "COMPLETE": "completed",
-            "FAILED": "failed",
-            "PENDING": "pending",
-            "CANCELLED": "cancelled",
-        }
-
+        now_iso = datetime.now().isoformat()
         return PayFastPayment(
             id=payload.get("m_payment_id", ""),
             provider="payfast",
@@ -105,18 +123,19 @@ class PayFast:
                 value=int(float(payload.get("amount_gross", 0)) * 100),
                 currency="ZAR",
             ),
-            status=status_map.get(payload.get("payment_status", ""), "pending"),
+            status=_STATUS_MAP.get(payload.get("payment_status", ""), "pending"),
             reference=payload.get("m_payment_id"),
             description=payload.get("item_name"),
             payment_url="",
             signature=payload.get("signature"),
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=now_iso,
+            updated_at=now_iso,
         )
 
     async def refund(self, request: RefundRequest) -> Refund:
         """Request a refund for a payment."""
-        refund_id = f"ref_{int(datetime.now().timestamp() * 1000)}"
+        refund_id = f"ref_{time_ns() // 1_000_000}"
+        now_iso = datetime.now().isoformat()
 
         return Refund(
             id=refund_id,
@@ -124,19 +143,26 @@ class PayFast:
             amount=Amount(value=request.amount or 0, currency="ZAR"),
             status="pending",
             reason=request.reason,
-            created_at=datetime.now().isoformat(),
-        )
-
-    def _generate_signature(self, data: dict[str, str]) -> str:
-        """Generate MD5 signature for PayFast."""
-        sorted_keys = sorted(data.keys())
-        param_string = "&".join(
-            f"{key}={data[key].replace(' ', '+')}"
-            for key in sorted_keys
-            if data[key] and data[key] != ""
+            created_at=now_iso,
         )
 
-        if self._config.passphrase:
-            param_string += f"&passphrase={self._config.passphrase}"
-
-        return hashlib.md5(param_string.encode()).hexdigest()
+    def _generate_signature(
+        self, data: dict[str, str], keys: tuple[str, ...] | None = None
+    ) -> str:
+        """
+        Generate MD5 signature for PayFast.
+
+        ``keys`` is an already-sorted superset of the keys in ``data``; when
+        omitted, the keys of ``data`` are sorted.
+        """
+        if keys is None:
+            keys = tuple(sorted(data))
+        signature = hashlib.md5("&".join([
+            f"{key}={value.replace(' ', '+')}"
+            for key in keys
+            if (value := data.get(key))
+        ]).encode())
+        # Feed the passphrase separately rather than concatenating it onto
+        # the parameter string, which would copy the whole string again.
+        signature.update(self._passphrase_suffix)
+        return signature.hexdigest()
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import base64
 import json
+import string
 from datetime import datetime, timedelta
-from typing import Literal
+from time import time_ns
+from typing import Iterable, Literal
 
 from luna.http import HttpClient
 from .types import (
@@ -29,8 +31,41 @@ SA_BANKS = {
     "AFRICAN_BANK": "african",
 }
 
+# Characters allowed in a ShapID
+_SHAP_ID_CHARS = frozenset(string.ascii_letters + string.digits + "@._-")
+
 SABank = Literal["absa", "capitec", "fnb", "nedbank", "standard", "investec", "discovery", "tymebank", "african"]
 
+# Valid account number lengths per bank
+_ACCOUNT_LENGTHS: dict[SABank, tuple[int, ...]] = {
+    "absa": (10, 11),
+    "capitec": (10,),
+    "fnb": (10, 11, 12),
+    "nedbank": (10, 11),
+    "standard": (9, 10, 11),
+    "investec": (10,),
+    "discovery": (10,),
+    "tymebank": (10,),
+    "african": (11,),
+}
+
+# Bound once so the QR/payment hot paths skip the module attribute lookups
+_now = datetime.now
+_b64encode = base64.b64encode
+_json_dumps = json.dumps
+
+# Deletes every ASCII non-digit
+_STRIP_NON_DIGITS = str.maketrans("", "", "".join(
+    chr(c) for c in range(128) if not chr(c).isdigit()
+))
+
+
+def _digit_count(value: str) -> int:
+    """Count the decimal digits in ``value``."""
+    if value.isascii():
+        return len(value.translate(_STRIP_NON_DIGITS))
+    return sum(1 for c in value if c.isdigit())
+
 
 class PayShap:
     """PayShap real-time payment integration."""
@@ -38,21 +73,29 @@ class PayShap:
     def __init__(self, client: HttpClient, config: PayShapConfig) -> None:
         self._client = client
         self._config = config
+        # QR payloads have a fixed shape, so they are assembled as text with
+        # only the variable values JSON-encoded; the output matches json.dumps
+        self._merchant_json = _json_dumps(config.merchant_id)
+        # The merchant-dependent head of each payment QR, encoded once
+        self._payment_qr_head = (
+            f'{{"type": "payshap", "merchantId": {self._merchant_json}, "amount": '
+        ).encode()
+        self._shap_id_prefix = f"shp_{config.merchant_id}_"
 
     async def create_payment(self, request: PayShapPaymentRequest) -> PayShapPayment:
         """Create a PayShap payment request."""
-        payment_id = f"ps_{int(datetime.now().timestamp() * 1000)}"
+        now = _now()
+        payment_id = f"ps_{time_ns() // 1_000_000}"
+        now_iso = now.isoformat()
         expiry_minutes = request.expiry_minutes or 30
-        expires_at = datetime.now() + timedelta(minutes=expiry_minutes)
+        expires_at = now + timedelta(minutes=expiry_minutes)
 
         # Generate QR code data
-        qr_data = json.dumps({
-            "type": "payshap",
-            "merchantId": self._config.merchant_id,
-            "amount": request.amount,
-            "reference": request.reference,
-        })
-        qr_code = base64.b64encode(qr_data.encode()).decode()
+        qr_tail = (
+            f'{_json_dumps(request.amount)}, '
+            f'"reference": {_json_dumps(request.reference)}}}'
+        )
+        qr_code = _b64encode(self._payment_qr_head + qr_tail.encode()).decode()
 
         return PayShapPayment(
             id=payment_id,
@@ -63,12 +106,14 @@ class PayShap:
             reference=request.reference,
             qr_code=qr_code,
             expires_at=expires_at.isoformat(),
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=now_iso,
+            updated_at=now_iso,
         )
 
     async def get_payment(self, payment_id: str) -> PayShapPayment:
         """Get payment status."""
+        now = _now()
+        now_iso = now.isoformat()
         return PayShapPayment(
             id=payment_id,
             provider="payshap",
@@ -76,22 +121,21 @@ class PayShap:
             amount=Amount(value=0, currency="ZAR"),
             status="pending",
             reference=payment_id,
-            expires_at=(datetime.now() + timedelta(minutes=30)).isoformat(),
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            expires_at=(now + timedelta(minutes=30)).isoformat(),
+            created_at=now_iso,
+            updated_at=now_iso,
         )
 
     async def cancel_payment(self, payment_id: str) -> PayShapPayment:
         """Cancel a pending payment."""
         payment = await self.get_payment(payment_id)
         payment.status = "cancelled"
-        payment.updated_at = datetime.now().isoformat()
+        payment.updated_at = _now().isoformat()
         return payment
 
     async def lookup_shap_id(self, shap_id: str) -> dict:
         """Lookup a ShapID (payment proxy)."""
-        import re
-        is_valid = bool(re.match(r"^[a-zA-Z0-9@._-]+$", shap_id)) and len(shap_id) >= 5
+        is_valid = len(shap_id) >= 5 and _SHAP_ID_CHARS.issuperset(shap_id)
 
         return {
             "valid": is_valid,
@@ -105,38 +149,31 @@ class PayShap:
         reference: str | None = None,
     ) -> dict:
         """Generate a QR code for receiving payments."""
-        shap_id = f"shp_{self._config.merchant_id}_{int(datetime.now().timestamp())}"
+        shap_id = f"{self._shap_id_prefix}{time_ns() // 1_000_000_000}"
 
-        qr_data = json.dumps({
-            "type": "payshap_receive",
-            "shapId": shap_id,
-            "merchantId": self._config.merchant_id,
-            "amount": amount,
-            "reference": reference,
-        })
+        qr_data = (
+            f'{{"type": "payshap_receive", "shapId": {_json_dumps(shap_id)}, '
+            f'"merchantId": {self._merchant_json}, "amount": {_json_dumps(amount)}, '
+            f'"reference": {_json_dumps(reference)}}}'
+        )
 
         return {
-            "qr_code": base64.b64encode(qr_data.encode()).decode(),
+            "qr_code": _b64encode(qr_data.encode()).decode(),
             "shap_id": shap_id,
         }
 
     def validate_bank_account(self, account_number: str, bank_id: SABank) -> bool:
         """Validate a South African bank account number format."""
-        account_lengths: dict[SABank, list[int]] = {
-            "absa": [10, 11],
-            "capitec": [10],
-            "fnb": [10, 11, 12],
-            "nedbank": [10, 11],
-            "standard": [9, 10, 11],
-            "investec": [10],
-            "discovery": [10],
-            "tymebank": [10],
-            "african": [11],
-        }
-
-        valid_lengths = account_lengths.get(bank_id)
+        valid_lengths = _ACCOUNT_LENGTHS.get(bank_id)
         if not valid_lengths:
             return False
-
-        digits_only = "".join(c for c in account_number if c.isdigit())
-        return len(digits_only) in valid_lengths
+        return _digit_count(account_number) in valid_lengths
+
+    def validate_bank_accounts(
+        self, accounts: Iterable[tuple[str, SABank]]
+    ) -> list[bool]:
+        """Validate many ``(account_number, bank_id)`` pairs, e.g. for batch onboarding."""
+        return [
+            self.validate_bank_account(account_number, bank_id)
+            for account_number, bank_id in accounts
+        ]
@@ -13,14 +13,14 @@ PaymentStatus = Literal["pending", "processing", "completed", "failed", "cancell
 PaymentMethod = Literal["eft", "cc", "dc", "mp", "cd", "sc"]  # EFT, Credit, Debit, Mobicred, Cash Deposit, SnapScan
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Amount:
     """Monetary amount."""
     value: int  # In cents
     currency: str = "ZAR"
 
 
-@dataclass
+@dataclass(slots=True)
 class PayFastConfig:
     """PayFast configuration."""
     merchant_id: str
@@ -29,7 +29,7 @@ class PayFastConfig:
     sandbox: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class OzowConfig:
     """Ozow configuration."""
     site_code: str
@@ -38,7 +38,7 @@ class OzowConfig:
     sandbox: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class YocoConfig:
     """Yoco configuration."""
     secret_key: str
@@ -46,7 +46,7 @@ class YocoConfig:
     sandbox: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PayShapConfig:
     """PayShap configuration."""
     merchant_id: str
@@ -55,7 +55,7 @@ class PayShapConfig:
     sandbox: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentsConfig:
     """Combined payments configuration."""
     payfast: Optional[PayFastConfig] = None
@@ -66,7 +66,7 @@ class PaymentsConfig:
 
 # Request/Response Models
 
-@dataclass
+@dataclass(slots=True)
 class PayFastPaymentRequest:
     """PayFast payment request."""
     amount: float
@@ -86,7 +86,7 @@ class PayFastPaymentRequest:
     custom_int2: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PayFastPayment:
     """PayFast payment response."""
     id: str
@@ -102,7 +102,7 @@ class PayFastPayment:
     updated_at: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class OzowPaymentRequest:
     """Ozow payment request."""
     amount: float
@@ -119,7 +119,7 @@ class OzowPaymentRequest:
     customer_phone: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OzowPayment:
     """Ozow payment response."""
     id: str
@@ -134,7 +134,7 @@ class OzowPayment:
     updated_at: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class YocoPaymentRequest:
     """Yoco payment request."""
     amount: int  # In cents
@@ -146,7 +146,7 @@ class YocoPaymentRequest:
     line_items: Optional[list] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class YocoPayment:
     """Yoco payment response."""
     id: str
@@ -161,7 +161,7 @@ class YocoPayment:
     updated_at: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class PayShapPaymentRequest:
     """PayShap payment request."""
     amount: float
@@ -172,7 +172,7 @@ class PayShapPaymentRequest:
     expiry_minutes: int = 30
 
 
-@dataclass
+@dataclass(slots=True)
 class PayShapPayment:
     """PayShap payment response."""
     id: str
@@ -187,7 +187,7 @@ class PayShapPayment:
     updated_at: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class RefundRequest:
     """Refund request."""
     payment_id: str
@@ -195,7 +195,7 @@ class RefundRequest:
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Refund:
     """Refund response."""
     id: str
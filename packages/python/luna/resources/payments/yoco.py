@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 import hmac
 from datetime import datetime
+from time import time_ns
 from typing import Any
 
 from luna.http import HttpClient
@@ -15,8 +16,16 @@ from .types import (
     RefundRequest,
     Refund,
     Amount,
+    PaymentStatus,
 )
 
+# Yoco webhook event types, mapped to payment statuses
+_STATUS_MAP: dict[str, PaymentStatus] = {
+    "payment.succeeded": "completed",
+    "payment.failed": "failed",
+    "payment.cancelled": "cancelled",
+}
+
 
 class Yoco:
     """Yoco online payment integration."""
@@ -24,6 +33,8 @@ class Yoco:
     def __init__(self, client: HttpClient, config: YocoConfig) -> None:
         self._client = client
         self._config = config
+        # Keyed once; verify_webhook copies it instead of re-deriving the pads.
+        self._hmac = hmac.new(config.secret_key.encode(), digestmod=hashlib.sha256)
 
     async def create_payment(self, request: YocoPaymentRequest) -> YocoPayment:
         """Create a checkout session and get redirect URL."""
@@ -53,23 +64,21 @@ class Yoco:
             updated_at=data["updatedAt"],
         )
 
-    def verify_webhook(self, payload: str, signature: str) -> bool:
+    def verify_webhook(self, payload: str | bytes, signature: str) -> bool:
         """Verify webhook signature."""
-        expected_signature = hmac.new(
-            self._config.secret_key.encode(),
-            payload.encode(),
-            hashlib.sha256,
-        ).hexdigest()
-        return signature == expected_signature
+        try:
+            received = bytes.fromhex(signature)
+        except ValueError:
+            return False
+        if isinstance(payload, str):
+            payload = payload.encode()
+        mac = self._hmac.copy()
+        mac.update(payload)
+        return hmac.compare_digest(mac.digest(), received)
 
     def process_webhook(self, payload: dict[str, Any]) -> YocoPayment:
         """Process webhook event."""
-        status_map = {
-            "payment.succeeded": "completed",
-            "payment.failed": "failed",
-            "payment.cancelled": "cancelled",
-        }
-
+        now_iso = datetime.now().isoformat()
         event_type = payload.get("type", "")
         payment_data = payload.get("payload", {})
 
@@ -81,17 +90,18 @@ class Yoco:
                 value=payment_data.get("amount", 0),
                 currency=payment_data.get("currency", "ZAR"),
             ),
-            status=status_map.get(event_type, "pending"),
+            status=_STATUS_MAP.get(event_type, "pending"),
             reference=payment_data.get("id"),
             metadata=payment_data.get("metadata"),
             redirect_url="",
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=now_iso,
+            updated_at=now_iso,
         )
 
     async def refund(self, request: RefundRequest) -> Refund:
         """Request a refund."""
-        refund_id = f"ref_{int(datetime.now().timestamp() * 1000)}"
+        refund_id = f"ref_{time_ns() // 1_000_000}"
+        now_iso = datetime.now().isoformat()
 
         return Refund(
             id=refund_id,
@@ -99,5 +109,5 @@ class Yoco:
             amount=Amount(value=request.amount or 0, currency="ZAR"),
             status="pending",
             reason=request.reason,
-            created_at=datetime.now().isoformat(),
+            created_at=now_iso,
         )
@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING
 
+from luna.http.types import RequestConfig
 from luna.types import Project, ProjectCreate, ProjectUpdate, ProjectList
 
 if TYPE_CHECKING:
@@ -46,8 +47,6 @@ class ProjectsResource:
         cursor: str | None = None,
     ) -> ProjectList:
         """List all projects with pagination."""
-        from luna.http.types import RequestConfig
-
         response = await self._http_client.request(
             RequestConfig(
                 method="GET",
@@ -62,8 +61,6 @@ class ProjectsResource:
 
     async def get(self, project_id: str) -> Project:
         """Get a project by ID."""
-        from luna.http.types import RequestConfig
-
         self._validate_project_id(project_id)
 
         response = await self._http_client.request(
@@ -76,8 +73,6 @@ class ProjectsResource:
 
     async def create(self, data: ProjectCreate) -> Project:
         """Create a new project."""
-        from luna.http.types import RequestConfig
-
         response = await self._http_client.request(
             RequestConfig(
                 method="POST",
@@ -89,8 +84,6 @@ class ProjectsResource:
 
     async def update(self, project_id: str, data: ProjectUpdate) -> Project:
         """Update an existing project."""
-        from luna.http.types import RequestConfig
-
         self._validate_project_id(project_id)
 
         response = await self._http_client.request(
@@ -104,8 +97,6 @@ class ProjectsResource:
 
     async def delete(self, project_id: str) -> None:
         """Delete a project."""
-        from luna.http.types import RequestConfig
-
         self._validate_project_id(project_id)
 
         await self._http_client.request(
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import cast
+import asyncio
+import builtins
+from typing import Sequence, cast
 
 from luna.http import HttpClient
 from luna.types import (
@@ -72,8 +74,29 @@ class ResidencesResource:
         )
         return Residence.model_validate(resp.data)
 
-    def iterate(self, params: ResidenceSearch | None = None) -> Paginator[Residence]:
-        """Iterate over residences."""
+    async def get_many(
+        self, ids: Sequence[str], max_concurrency: int = 10
+    ) -> builtins.list[Residence]:
+        """
+        Get several residences by ID, in the order given.
+
+        There is no bulk endpoint, so the requests are issued concurrently
+        with at most ``max_concurrency`` in flight.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(id: str) -> Residence:
+            async with semaphore:
+                return await self.get(id)
+
+        return list(await asyncio.gather(*(fetch(id) for id in ids)))
+
+    def iterate(
+        self,
+        params: ResidenceSearch | None = None,
+        max_items: int | None = None,
+    ) -> Paginator[Residence]:
+        """Iterate over residences, stopping after ``max_items`` if given."""
         
         async def fetch_next(cursor: str | None) -> ResidenceList:
             if params:
@@ -82,7 +105,7 @@ class ResidencesResource:
                 return await self.list(params=p)
             return await self.list(cursor=cursor)
 
-        return Paginator(fetch_next)
+        return Paginator(fetch_next, max_items=max_items)
 
 
 class CampusesResource:
@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING
 
+from luna.http.types import RequestConfig
 from luna.types import User, UserCreate, UserUpdate, UserList, PaginationParams
 from luna.resources.pagination import Paginator
 
@@ -47,8 +48,6 @@ class UsersResource:
         cursor: str | None = None,
     ) -> UserList:
         """List all users with pagination."""
-        from luna.http.types import RequestConfig
-
         response = await self._http_client.request(
             RequestConfig(
                 method="GET",
@@ -61,19 +60,25 @@ class UsersResource:
         )
         return UserList.model_validate(response.data)
 
-    def iterate(self, limit: int | None = None) -> Paginator[User]:
-        """Iterate over all users automatically handling pagination."""
-        from luna.resources.pagination import Paginator
-        
+    def iterate(
+        self,
+        limit: int | None = None,
+        max_items: int | None = None,
+    ) -> Paginator[User]:
+        """
+        Iterate over all users automatically handling pagination.
+
+        Args:
+            limit: Page size for each request
+            max_items: Stop after this many users without fetching more pages
+        """
         async def fetch_next(cursor: str | None) -> UserList:
             return await self.list(limit=limit, cursor=cursor)
             
-        return Paginator(fetch_next)
+        return Paginator(fetch_next, max_items=max_items)
 
     async def get(self, user_id: str) -> User:
         """Get a user by ID."""
-        from luna.http.types import RequestConfig
-
         self._validate_user_id(user_id)
 
         response = await self._http_client.request(
@@ -86,8 +91,6 @@ class UsersResource:
 
     async def create(self, data: UserCreate) -> User:
         """Create a new user."""
-        from luna.http.types import RequestConfig
-
         response = await self._http_client.request(
             RequestConfig(
                 method="POST",
@@ -99,8 +102,6 @@ class UsersResource:
 
     async def update(self, user_id: str, data: UserUpdate) -> User:
         """Update an existing user."""
-        from luna.http.types import RequestConfig
-
         self._validate_user_id(user_id)
 
         response = await self._http_client.request(
@@ -114,8 +115,6 @@ class UsersResource:
 
     async def delete(self, user_id: str) -> None:
         """Delete a user."""
-        from luna.http.types import RequestConfig
-
         self._validate_user_id(user_id)
 
         await self._http_client.request(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Optional
 
 from luna.http import HttpClient
@@ -82,45 +83,31 @@ class ZATools:
         self._client = client
         self._config = config or ZAToolsConfig()
 
-        # Lazy-initialized services
-        self._cipc: Optional[CIPC] = None
-        self._bbbee: Optional[BBBEE] = None
+    # Services are created on first access and cached on the instance
 
-        # Standalone utilities (no API calls needed)
-        self._id_validation: Optional[IDValidation] = None
-        self._address: Optional[AddressUtils] = None
-
-    @property
+    @cached_property
     def cipc(self) -> CIPC:
         """Get CIPC service instance."""
-        if not self._cipc:
-            self._cipc = CIPC(
-                self._client, 
-                self._config.cipc or CIPCConfig(), 
-                strict=self._config.strict
-            )
-        return self._cipc
-
-    @property
+        return CIPC(
+            self._client,
+            self._config.cipc or CIPCConfig(),
+            strict=self._config.strict,
+        )
+
+    @cached_property
     def bbbee(self) -> BBBEE:
         """Get B-BBEE service instance."""
-        if not self._bbbee:
-            self._bbbee = BBBEE(self._client, self._config.bbbee or BBBEEConfig())
-        return self._bbbee
+        return BBBEE(self._client, self._config.bbbee or BBBEEConfig())
 
-    @property
+    @cached_property
     def id_validation(self) -> IDValidation:
         """Get ID validation utility (no API needed)."""
-        if not self._id_validation:
-            self._id_validation = IDValidation()
-        return self._id_validation
+        return IDValidation()
 
-    @property
+    @cached_property
     def address(self) -> AddressUtils:
         """Get address utilities (no API needed)."""
-        if not self._address:
-            self._address = AddressUtils()
-        return self._address
+        return AddressUtils()
 
     def validate_id(self, id_number: str) -> SAIDInfo:
         """Convenience method to validate SA ID number."""
@@ -3,9 +3,21 @@
 from __future__ import annotations
 
 import re
+import string
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Iterable
 from .types import SAAddress, SAProvince
 
 
+_POSTAL_SEARCH_RE = re.compile(r"\b(\d{4})\b")
+
+
+def _is_4digit(value: str) -> bool:
+    """Whether ``value`` is exactly four decimal digits."""
+    return len(value) == 4 and value.isdecimal()
+
+
 # Province postal code ranges
 POSTAL_CODE_RANGES: dict[SAProvince, list[tuple[int, int]]] = {
     "EC": [(5000, 5999), (6000, 6499)],
@@ -19,6 +31,47 @@ POSTAL_CODE_RANGES: dict[SAProvince, list[tuple[int, int]]] = {
     "WC": [(6500, 8099)],
 }
 
+
+def _build_postal_index() -> tuple[tuple[int, ...], tuple[SAProvince | None, ...]]:
+    """
+    Flatten POSTAL_CODE_RANGES into sorted segment starts for bisection.
+
+    Overlapping ranges resolve to the first matching province in
+    POSTAL_CODE_RANGES order; codes in gaps map to None.
+    """
+    bounds = sorted(
+        {start for ranges in POSTAL_CODE_RANGES.values() for start, _ in ranges}
+        | {end + 1 for ranges in POSTAL_CODE_RANGES.values() for _, end in ranges}
+    )
+    starts: list[int] = []
+    provinces: list[SAProvince | None] = []
+    for code in bounds:
+        province = next(
+            (
+                province
+                for province, ranges in POSTAL_CODE_RANGES.items()
+                if any(start <= code <= end for start, end in ranges)
+            ),
+            None,
+        )
+        if not provinces or provinces[-1] != province:
+            starts.append(code)
+            provinces.append(province)
+    return tuple(starts), tuple(provinces)
+
+
+_POSTAL_STARTS, _POSTAL_PROVINCES = _build_postal_index()
+
+
+@lru_cache(maxsize=10_000)
+def _province_from_postal_code(postal_code: str) -> SAProvince | None:
+    """Resolve a postal code to its province; memoized as codes repeat in bulk."""
+    if not _is_4digit(postal_code):
+        return None
+
+    index = bisect_right(_POSTAL_STARTS, int(postal_code)) - 1
+    return _POSTAL_PROVINCES[index] if index >= 0 else None
+
 # SA cities to province mapping
 SA_CITIES: dict[str, SAProvince] = {
     "johannesburg": "GP",
@@ -38,6 +91,13 @@ SA_CITIES: dict[str, SAProvince] = {
     "centurion": "GP",
 }
 
+# Finds every city occurrence in one pass (the lookahead lets matches
+# overlap); SA_CITIES order decides between several cities
+_CITY_RE = re.compile(
+    "(?=(" + "|".join(re.escape(city) for city in sorted(SA_CITIES, key=len, reverse=True)) + "))"
+)
+_CITY_RANK = {city: rank for rank, city in enumerate(SA_CITIES)}
+
 # Province names
 PROVINCE_NAMES: dict[SAProvince, str] = {
     "EC": "Eastern Cape",
@@ -62,11 +122,10 @@ class AddressUtils:
 
         # Validate postal code
         if address.postal_code:
-            if not re.match(r"^\d{4}$", address.postal_code):
+            if not _is_4digit(address.postal_code):
                 errors.append("Postal code must be 4 digits")
             else:
-                code = int(address.postal_code)
-                detected_province = self.get_province_from_postal_code(address.postal_code)
+                detected_province = _province_from_postal_code(address.postal_code)
                 if address.province and detected_province and address.province != detected_province:
                     warnings.append(
                         f"Postal code {address.postal_code} belongs to {PROVINCE_NAMES.get(detected_province, detected_province)}, "
@@ -105,17 +164,11 @@ class AddressUtils:
 
     def get_province_from_postal_code(self, postal_code: str) -> SAProvince | None:
         """Detect province from postal code."""
-        if not re.match(r"^\d{4}$", postal_code):
-            return None
+        return _province_from_postal_code(postal_code)
 
-        code = int(postal_code)
-
-        for province, ranges in POSTAL_CODE_RANGES.items():
-            for range_start, range_end in ranges:
-                if range_start <= code <= range_end:
-                    return province
-
-        return None
+    def provinces_from_postal_codes(self, postal_codes: Iterable[str]) -> list[SAProvince | None]:
+        """Detect the province for each of many postal codes."""
+        return list(map(_province_from_postal_code, postal_codes))
 
     def get_province_name(self, code: SAProvince) -> str:
         """Get full province name from code."""
@@ -123,10 +176,7 @@ class AddressUtils:
 
     def lookup_postal_code(self, postal_code: str) -> dict | None:
         """Look up postal code information."""
-        if not re.match(r"^\d{4}$", postal_code):
-            return None
-
-        province = self.get_province_from_postal_code(postal_code)
+        province = _province_from_postal_code(postal_code)
         if not province:
             return None
 
@@ -141,20 +191,20 @@ class AddressUtils:
         result = SAAddress(country="ZA")
 
         # Try to extract postal code
-        postal_match = re.search(r"\b(\d{4})\b", address_string)
-        if postal_match and postal_match.group(1):
-            result.postal_code = postal_match.group(1)
-            result.province = self.get_province_from_postal_code(postal_match.group(1))
+        postal_match = _POSTAL_SEARCH_RE.search(address_string)
+        if postal_match:
+            result.postal_code = postal_code = postal_match.group(1)
+            result.province = _province_from_postal_code(postal_code)
 
         # Try to extract city
-        for city, province in SA_CITIES.items():
-            if city in address_string.lower():
-                result.city = city.title()
-                result.province = result.province or province
-                break
+        found = {match.group(1) for match in _CITY_RE.finditer(address_string.lower())}
+        if found:
+            city = min(found, key=_CITY_RANK.__getitem__)
+            result.city = city.title()
+            result.province = result.province or SA_CITIES[city]
 
         return result
 
     def title_case(self, text: str) -> str:
         """Convert text to title case."""
-        return " ".join(word.capitalize() for word in text.split())
+        return string.capwords(text)
@@ -2,16 +2,67 @@
 
 from __future__ import annotations
 
+import copy
+from bisect import bisect_right
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Iterable, Optional
+
 from luna.http import HttpClient
+from luna.utils.cache import TTLCache
+from .cipc import _clean_registration_number
 from .types import BBBEEConfig, BBBEECertificate, BBBEELevel, BBBEEScorecard
 
 
+# Minimum points for levels 8 down to 1; _LEVELS[i] is the level reached
+# after clearing i thresholds
+_LEVEL_THRESHOLDS = (40, 55, 70, 75, 80, 90, 95, 100)
+_LEVELS: tuple[BBBEELevel, ...] = ("non-compliant", 8, 7, 6, 5, 4, 3, 2, 1)
+
+# Procurement recognition percentage per level
+_RECOGNITION: dict[BBBEELevel, int] = {
+    1: 135,
+    2: 125,
+    3: 110,
+    4: 100,
+    5: 80,
+    6: 60,
+    7: 50,
+    8: 10,
+    "non-compliant": 0,
+}
+
+
+@lru_cache(maxsize=2048)
+def _parse_expiry(expiry_date: str) -> datetime:
+    """Parse a certificate expiry date (memoized; audits re-check the same dates)."""
+    return datetime.fromisoformat(expiry_date.replace("Z", "+00:00"))
+
+
+def _now_for(expiry_date: datetime, now: Optional[datetime]) -> datetime:
+    """
+    Current time comparable with ``expiry_date``.
+
+    Naive expiry dates are local time, so a supplied aware ``now`` is
+    converted to local naive time for them (and a naive ``now`` is
+    treated as local time against aware expiry dates).
+    """
+    if now is None:
+        return datetime.now(expiry_date.tzinfo)
+    if expiry_date.tzinfo is None:
+        return now.astimezone().replace(tzinfo=None) if now.tzinfo is not None else now
+    return now if now.tzinfo is not None else now.astimezone()
+
+
 class BBBEE:
     """Broad-Based Black Economic Empowerment compliance verification."""
 
     def __init__(self, client: HttpClient, config: BBBEEConfig) -> None:
         self._client = client
         self._config = config
+        self._cache: Optional[TTLCache[str, BBBEECertificate]] = (
+            TTLCache(ttl=config.cache_ttl) if config.cache_ttl > 0 else None
+        )
 
     async def verify_certificate(self, certificate_number: str) -> BBBEECertificate | None:
         """Verify a B-BBEE certificate by number."""
@@ -26,16 +77,26 @@ class BBBEE:
 
     async def lookup_by_company(self, registration_number: str) -> BBBEECertificate | None:
         """Look up B-BBEE status by company registration number."""
+        # Keyed like CIPC lookups; results are copied in and out so callers
+        # can't mutate them
+        cache_key = _clean_registration_number(registration_number)
+        if self._cache is not None and (cached := self._cache.get(cache_key)) is not None:
+            return copy.deepcopy(cached)
+
         try:
             response = await self._client.request(
                 method="GET",
                 path="/v1/za/bbbee/lookup",
                 query={"registrationNumber": registration_number},
             )
-            return BBBEECertificate(**response.data)
+            certificate = BBBEECertificate(**response.data)
         except Exception:
             return None
 
+        if self._cache is not None:
+            self._cache.set(cache_key, copy.deepcopy(certificate))
+        return certificate
+
     async def meets_requirement(
         self,
         registration_number: str,
@@ -58,18 +119,7 @@ class BBBEE:
 
     def get_recognition_level(self, level: BBBEELevel) -> int:
         """Get procurement recognition percentage for a B-BBEE level."""
-        recognition_map = {
-            1: 135,
-            2: 125,
-            3: 110,
-            4: 100,
-            5: 80,
-            6: 60,
-            7: 50,
-            8: 10,
-            "non-compliant": 0,
-        }
-        return recognition_map.get(level, 0)
+        return _RECOGNITION.get(level, 0)
 
     def determine_enterprise_category(self, annual_revenue: float) -> dict:
         """Calculate EME or QSE status."""
@@ -109,35 +159,32 @@ class BBBEE:
 
     def _points_to_level(self, points: float) -> BBBEELevel:
         """Convert total points to B-BBEE level."""
-        if points >= 100:
-            return 1
-        if points >= 95:
-            return 2
-        if points >= 90:
-            return 3
-        if points >= 80:
-            return 4
-        if points >= 75:
-            return 5
-        if points >= 70:
-            return 6
-        if points >= 55:
-            return 7
-        if points >= 40:
-            return 8
-        return "non-compliant"
-
-    def is_certificate_valid(self, certificate: BBBEECertificate) -> bool:
-        """Check if a certificate is still valid."""
-        from datetime import datetime
-
-        expiry_date = datetime.fromisoformat(certificate.expiry_date.replace("Z", "+00:00"))
-        return certificate.is_valid and expiry_date > datetime.now(expiry_date.tzinfo)
-
-    def get_days_until_expiry(self, certificate: BBBEECertificate) -> int:
-        """Get days until certificate expiry."""
-        from datetime import datetime
-
-        expiry_date = datetime.fromisoformat(certificate.expiry_date.replace("Z", "+00:00"))
-        diff = expiry_date - datetime.now(expiry_date.tzinfo)
+        return _LEVELS[bisect_right(_LEVEL_THRESHOLDS, points)]
+
+    def is_certificate_valid(
+        self, certificate: BBBEECertificate, now: Optional[datetime] = None
+    ) -> bool:
+        """
+        Check if a certificate is still valid.
+
+        Pass ``now`` to check many certificates against one snapshot of
+        the current time instead of reading the clock per certificate.
+        """
+        expiry_date = _parse_expiry(certificate.expiry_date)
+        return certificate.is_valid and expiry_date > _now_for(expiry_date, now)
+
+    def get_days_until_expiry(
+        self, certificate: BBBEECertificate, now: Optional[datetime] = None
+    ) -> int:
+        """Get days until certificate expiry (``now`` as for is_certificate_valid)."""
+        expiry_date = _parse_expiry(certificate.expiry_date)
+        diff = expiry_date - _now_for(expiry_date, now)
         return diff.days
+
+    def filter_valid(
+        self, certificates: Iterable[BBBEECertificate], now: Optional[datetime] = None
+    ) -> list[BBBEECertificate]:
+        """Return the certificates that are still valid, checked against one time snapshot."""
+        if now is None:
+            now = datetime.now(timezone.utc)
+        return [c for c in certificates if self.is_certificate_valid(c, now)]
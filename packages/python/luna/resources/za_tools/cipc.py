@@ -2,13 +2,37 @@
 
 from __future__ import annotations
 
+import copy
 import re
 from typing import Optional
 
 from luna.http import HttpClient
+from luna.utils.cache import TTLCache
 from .types import CIPCConfig, Company, CompanyType, Director
 
 
+_REG_NUMBER_RE = re.compile(
+    r"^(?:\d{4}/\d{6}/\d{2}"  # 2020/123456/07
+    r"|\d{12}"                # 202012345607
+    r"|[A-Z]{2}\d{6})$"       # CK123456 (old CC format)
+)
+_TYPE_RE = re.compile(r"/(\d{2})$")
+
+# Registration number suffix -> company type
+_TYPE_MAP: dict[str, CompanyType] = {
+    "07": "PTY_LTD",
+    "06": "LTD",
+    "08": "NPC",
+    "23": "CC",
+    "21": "INC",
+}
+
+
+def _clean_registration_number(value: str) -> str:
+    """Remove all whitespace (anything str.isspace() accepts) and slashes."""
+    return "".join(value.split()).replace("/", "")
+
+
 class CIPC:
     """Companies and Intellectual Property Commission integration."""
 
@@ -16,24 +40,35 @@ class CIPC:
         self._client = client
         self._config = config
         self._strict = strict
+        self._cache: Optional[TTLCache[str, Company]] = (
+            TTLCache(ttl=config.cache_ttl) if config.cache_ttl > 0 else None
+        )
 
     async def lookup(self, registration_number: str) -> Company | None:
         """Search for a company by registration number."""
-        cleaned = re.sub(r"[\s/]", "", registration_number)
+        cleaned = _clean_registration_number(registration_number)
 
         # Strict Validation ("Rust" safety)
         if self._strict and not self.is_valid_registration_number(cleaned):
             raise ValueError(f"Invalid registration number format (strict mode): {registration_number}")
 
+        # Cached results are copied in and out so callers can't mutate them
+        if self._cache is not None and (cached := self._cache.get(cleaned)) is not None:
+            return copy.deepcopy(cached)
+
         try:
             response = await self._client.request(
                 method="GET",
                 path=f"/v1/za/cipc/companies/{cleaned}",
             )
-            return Company(**response.data)
+            company = Company(**response.data)
         except Exception:
             return None
 
+        if self._cache is not None:
+            self._cache.set(cleaned, copy.deepcopy(company))
+        return company
+
     async def search_by_name(self, name: str, limit: int = 10) -> list[Company]:
         """Search for companies by name."""
         response = await self._client.request(
@@ -74,32 +109,19 @@ class CIPC:
 
     def is_valid_registration_number(self, reg_number: str) -> bool:
         """Validate registration number format."""
-        patterns = [
-            r"^\d{4}/\d{6}/\d{2}$",  # 2020/123456/07
-            r"^\d{12}$",             # 202012345607
-            r"^[A-Z]{2}\d{6}$",      # CK123456 (old CC format)
-        ]
-        return any(re.match(p, reg_number) for p in patterns)
+        return _REG_NUMBER_RE.match(reg_number) is not None
 
     def parse_company_type(self, reg_number: str) -> CompanyType | None:
         """Parse company type from registration number."""
-        match = re.search(r"/(\d{2})$", reg_number)
+        match = _TYPE_RE.search(reg_number)
         if not match:
             return None
 
-        type_code = match.group(1)
-        type_map: dict[str, CompanyType] = {
-            "07": "PTY_LTD",
-            "06": "LTD",
-            "08": "NPC",
-            "23": "CC",
-            "21": "INC",
-        }
-        return type_map.get(type_code)
+        return _TYPE_MAP.get(match.group(1))
 
     def format_registration_number(self, reg_number: str) -> str:
         """Format registration number for display."""
-        cleaned = re.sub(r"[\s/]", "", reg_number)
+        cleaned = _clean_registration_number(reg_number)
 
         if len(cleaned) == 12:
             return f"{cleaned[:4]}/{cleaned[4:10]}/{cleaned[10:]}"
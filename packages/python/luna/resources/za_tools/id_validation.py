@@ -2,14 +2,32 @@
 
 from __future__ import annotations
 
-import re
+import random
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Literal
+from typing import Iterable, Literal
 
 from .types import SAIDInfo
 
 
+# Luhn digit values as bytes.translate tables: ASCII digit -> value, and
+# ASCII digit -> value doubled with its digits summed (2*d - 9 when > 9)
+_LUHN_PLAIN = bytes.maketrans(b"0123456789", bytes(range(10)))
+_LUHN_DOUBLED = bytes.maketrans(b"0123456789", bytes((0, 2, 4, 6, 8, 1, 3, 5, 7, 9)))
+
+
+def _clean_id_number(value: str) -> str:
+    """Remove all whitespace (anything str.isspace() accepts) and hyphens."""
+    return "".join(value.split()).replace("-", "")
+
+
+def _digit_bytes(digits: str) -> bytes:
+    """ASCII bytes of an all-digit string; other decimal digits are normalised."""
+    if not digits.isascii():
+        digits = "".join(str(int(c)) for c in digits)
+    return digits.encode()
+
+
 class IDValidation:
     """
     South African ID number validation and parsing.
@@ -24,7 +42,7 @@ class IDValidation:
 
     def validate(self, id_number: str) -> SAIDInfo:
         """Validate and parse a South African ID number."""
-        cleaned = re.sub(r"[\s-]", "", id_number)
+        cleaned = _clean_id_number(id_number)
 
         if len(cleaned) != 13:
             return self._invalid_result(id_number, "ID number must be 13 digits")
@@ -32,12 +50,13 @@ class IDValidation:
         if not cleaned.isdigit():
             return self._invalid_result(id_number, "ID number must contain only digits")
 
-        # Extract components
-        year = int(cleaned[0:2])
-        month = int(cleaned[2:4])
-        day = int(cleaned[4:6])
-        gender_digits = int(cleaned[6:10])
-        citizenship_digit = int(cleaned[10:11])
+        # Extract components straight from the ASCII digit bytes (b"0" == 48)
+        digits = _digit_bytes(cleaned)
+        year = (digits[0] - 48) * 10 + digits[1] - 48
+        month = (digits[2] - 48) * 10 + digits[3] - 48
+        day = (digits[4] - 48) * 10 + digits[5] - 48
+        is_male = digits[6] >= 53  # gender sequence 5000-9999
+        is_sa_citizen = digits[10] == 48
 
         # Validate date
         full_year = 2000 + year if year <= 30 else 1900 + year
@@ -53,14 +72,19 @@ class IDValidation:
             id_number=cleaned,
             is_valid=checksum_valid,
             date_of_birth=date_of_birth,
-            gender="male" if gender_digits >= 5000 else "female",
-            is_sa_citizen=citizenship_digit == 0,
+            gender="male" if is_male else "female",
+            is_sa_citizen=is_sa_citizen,
             checksum_valid=checksum_valid,
         )
 
     def is_valid(self, id_number: str) -> bool:
         """Quick validation - returns boolean."""
-        return self.validate(id_number).is_valid
+        return self._fast_is_valid(_clean_id_number(id_number))
+
+    def is_valid_many(self, id_numbers: Iterable[str]) -> list[bool]:
+        """Validate many ID numbers, e.g. for batch onboarding."""
+        fast_is_valid = self._fast_is_valid
+        return [fast_is_valid(_clean_id_number(id_number)) for id_number in id_numbers]
 
     def get_date_of_birth(self, id_number: str) -> date | None:
         """Extract date of birth from ID number."""
@@ -91,8 +115,6 @@ class IDValidation:
         is_citizen: bool = True,
     ) -> str:
         """Generate a valid SA ID number (for testing)."""
-        import random
-
         dob = date_of_birth or date(1990, 1, 1)
         year = str(dob.year)[-2:]
         month = str(dob.month).zfill(2)
@@ -115,6 +137,24 @@ class IDValidation:
 
         return f"{partial}{checksum}"
 
+    def _fast_is_valid(self, cleaned: str) -> bool:
+        """Run the same checks as validate() without building an SAIDInfo."""
+        if len(cleaned) != 13 or not cleaned.isdigit():
+            return False
+
+        digits = _digit_bytes(cleaned)
+        year = (digits[0] - 48) * 10 + digits[1] - 48
+        try:
+            date(
+                2000 + year if year <= 30 else 1900 + year,
+                (digits[2] - 48) * 10 + digits[3] - 48,
+                (digits[4] - 48) * 10 + digits[5] - 48,
+            )
+        except ValueError:
+            return False
+
+        return self._validate_luhn(cleaned)
+
     def _invalid_result(self, id_number: str, reason: str) -> SAIDInfo:
         """Return invalid result."""
         return SAIDInfo(
@@ -128,25 +168,19 @@ class IDValidation:
 
     def _validate_luhn(self, number: str) -> bool:
         """Validate using Luhn algorithm."""
-        total = 0
-        is_even = False
-
-        for i in range(len(number) - 1, -1, -1):
-            digit = int(number[i])
-
-            if is_even:
-                digit *= 2
-                if digit > 9:
-                    digit -= 9
-
-            total += digit
-            is_even = not is_even
+        if not number.isascii():
+            # Other decimal digits pass isdigit(); normalise them to ASCII
+            number = "".join(str(int(c)) for c in number)
 
+        # Every second digit from the right is doubled
+        digits = number[::-1].encode()
+        total = sum(digits[::2].translate(_LUHN_PLAIN)) + sum(digits[1::2].translate(_LUHN_DOUBLED))
         return total % 10 == 0
 
     def _calculate_luhn_checksum(self, partial: str) -> str:
         """Calculate Luhn checksum digit."""
-        for i in range(10):
-            if self._validate_luhn(partial + str(i)):
-                return str(i)
-        return "0"
+        # With the check digit appended, the partial's last digit becomes the
+        # second from the right, so doubling starts there
+        digits = partial[::-1].encode()
+        total = sum(digits[::2].translate(_LUHN_DOUBLED)) + sum(digits[1::2].translate(_LUHN_PLAIN))
+        return str(-total % 10)
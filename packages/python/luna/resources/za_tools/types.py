@@ -12,14 +12,15 @@ CompanyType = Literal["PTY_LTD", "LTD", "NPC", "CC", "INC"]
 CompanyStatus = Literal["active", "in_business_rescue", "deregistered", "liquidated", "dissolved"]
 
 
-@dataclass
+@dataclass(slots=True)
 class CIPCConfig:
     """CIPC configuration."""
     api_key: Optional[str] = None
     sandbox: bool = False
+    cache_ttl: float = 0  # Seconds to reuse a company lookup; 0 disables caching
 
 
-@dataclass
+@dataclass(slots=True)
 class Director:
     """Company director information."""
     name: str
@@ -29,7 +30,7 @@ class Director:
     resigned_date: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Company:
     """Company information."""
     registration_number: str
@@ -47,14 +48,15 @@ class Company:
 BBBEELevel = int | Literal["non-compliant"]
 
 
-@dataclass
+@dataclass(slots=True)
 class BBBEEConfig:
     """B-BBEE configuration."""
     api_key: Optional[str] = None
     sandbox: bool = False
+    cache_ttl: float = 0  # Seconds to reuse a company lookup; 0 disables caching
 
 
-@dataclass
+@dataclass(slots=True)
 class BBBEECertificate:
     """B-BBEE certificate information."""
     certificate_number: str
@@ -68,7 +70,7 @@ class BBBEECertificate:
     scorecard: Optional[dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BBBEEScorecard:
     """B-BBEE scorecard breakdown."""
     ownership: float = 0
@@ -79,7 +81,7 @@ class BBBEEScorecard:
 
 
 # ID Validation Types
-@dataclass
+@dataclass(slots=True)
 class SAIDInfo:
     """South African ID information."""
     id_number: str
@@ -94,7 +96,7 @@ class SAIDInfo:
 SAProvince = Literal["EC", "FS", "GP", "KZN", "LP", "MP", "NC", "NW", "WC"]
 
 
-@dataclass
+@dataclass(slots=True)
 class SAAddress:
     """South African address."""
     street: Optional[str] = None
@@ -105,7 +107,7 @@ class SAAddress:
     country: str = "ZA"
 
 
-@dataclass
+@dataclass(slots=True)
 class ZAToolsConfig:
     """Combined ZA tools configuration."""
     cipc: Optional[CIPCConfig] = None
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TypeVar
+from typing import Any, TypeVar
 from pydantic import BaseModel, Field
 
 
@@ -226,6 +226,13 @@ class CompletionResponse(BaseModel):
     id: str
     choices: list[dict[str, Any]]
 
+    @property
+    def text(self) -> str:
+        """Message content of the first choice."""
+        if not self.choices:
+            return ""
+        return str(self.choices[0]["message"]["content"] or "")
+
 
 class Workflow(BaseModel):
     """Automation Workflow."""
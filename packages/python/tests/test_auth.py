@@ -1,9 +1,13 @@
 """Tests for auth providers."""
 
+import asyncio
+
 import pytest
+import respx
+from httpx import Response
 from datetime import datetime, timedelta
 
-from luna.auth import ApiKeyAuth, TokenAuth
+from luna.auth import ApiKeyAuth, TokenAuth, TokenPair
 from luna.errors import AuthenticationError
 
 
@@ -71,11 +75,32 @@ class TestTokenAuth:
         
         assert headers == {"Authorization": f"Bearer {self.access_token}"}
 
+    @pytest.mark.asyncio
+    async def test_get_headers_reused_until_tokens_change(self) -> None:
+        """Should return the same read-only headers until tokens change."""
+        auth = TokenAuth(access_token=self.access_token)
+        headers = await auth.get_headers()
+
+        assert await auth.get_headers() is headers
+        with pytest.raises(TypeError):
+            headers["Authorization"] = "Bearer other"  # type: ignore[index]
+
+        auth.update_tokens(TokenPair(access_token="new-token", refresh_token=""))
+        assert await auth.get_headers() == {"Authorization": "Bearer new-token"}
+
     def test_needs_refresh_without_expiry(self) -> None:
         """Should not need refresh without expiry."""
         auth = TokenAuth(access_token=self.access_token)
         assert auth.needs_refresh() is False
 
+    def test_needs_refresh_near_expiry(self) -> None:
+        """Should need refresh within five minutes of expiry."""
+        auth = TokenAuth(
+            access_token=self.access_token,
+            expires_at=datetime.now() + timedelta(minutes=4),
+        )
+        assert auth.needs_refresh() is True
+
     def test_update_tokens(self) -> None:
         """Should update tokens."""
         auth = TokenAuth(
@@ -92,3 +117,60 @@ class TestTokenAuth:
         ))
         
         assert auth.needs_refresh() is False
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_refresh_reuses_http_client(self) -> None:
+        """Should reuse one HTTP client across refreshes."""
+        respx.post("https://api.eclipse.dev/v1/auth/refresh").mock(
+            return_value=Response(
+                200,
+                json={
+                    "access_token": "new-access-token",
+                    "refresh_token": "new-refresh-token",
+                    "expires_in": 0,
+                },
+            )
+        )
+        auth = TokenAuth(
+            access_token=self.access_token,
+            refresh_token=self.refresh_token,
+            expires_at=datetime.now(),
+        )
+
+        await auth.refresh()
+        http_client = auth._http
+        await auth.refresh()
+
+        assert http_client is not None
+        assert auth._http is http_client
+        assert respx.calls.call_count == 2
+
+        await auth.aclose()
+        assert http_client.is_closed
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_concurrent_refreshes_share_one_request(self) -> None:
+        """Should send a single refresh request for concurrent callers."""
+        respx.post("https://api.eclipse.dev/v1/auth/refresh").mock(
+            return_value=Response(
+                200,
+                json={
+                    "access_token": "new-access-token",
+                    "refresh_token": "new-refresh-token",
+                    "expires_in": 3600,
+                },
+            )
+        )
+        auth = TokenAuth(
+            access_token=self.access_token,
+            refresh_token=self.refresh_token,
+            expires_at=datetime.now(),
+        )
+
+        results = await asyncio.gather(*(auth.get_headers() for _ in range(5)))
+
+        assert respx.calls.call_count == 1
+        assert all(h == {"Authorization": "Bearer new-access-token"} for h in results)
+        await auth.aclose()
@@ -0,0 +1,82 @@
+"""Unit tests for pagination helpers."""
+import asyncio
+
+import pytest
+
+from luna.resources.pagination import Paginator, prefetched
+from luna.types import UserList
+from tests.mocks.fixtures import MOCK_USERS
+
+
+def make_paginator(
+    pages: list[dict], max_items: int | None = None
+) -> tuple[Paginator, list[str | None]]:
+    """Create a paginator over canned pages, recording requested cursors."""
+    cursors: list[str | None] = []
+
+    async def fetch_next(cursor: str | None) -> UserList:
+        cursors.append(cursor)
+        await asyncio.sleep(0)
+        return UserList.model_validate(pages[len(cursors) - 1])
+
+    return Paginator(fetch_next, max_items=max_items), cursors
+
+
+class TestPrefetched:
+    """Tests for prefetched()"""
+
+    async def test_yields_all_items_in_order(self) -> None:
+        """Should yield the same items as the wrapped iterator."""
+        paginator, cursors = make_paginator([
+            {"data": MOCK_USERS[:1], "has_more": True, "next_cursor": "c1"},
+            {"data": MOCK_USERS[1:], "has_more": False},
+        ])
+
+        users = [user async for user in prefetched(paginator, depth=1)]
+
+        assert [u.id for u in users] == [u["id"] for u in MOCK_USERS]
+        assert cursors == [None, "c1"]
+
+    async def test_fetches_next_page_ahead_of_consumer(self) -> None:
+        """Should request the next page before the current one is consumed."""
+        paginator, cursors = make_paginator([
+            {"data": MOCK_USERS[:1], "has_more": True, "next_cursor": "c1"},
+            {"data": MOCK_USERS[1:], "has_more": False},
+        ])
+        iterator = prefetched(paginator, depth=1)
+
+        await iterator.__anext__()
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert cursors == [None, "c1"]
+        await iterator.aclose()
+
+    async def test_propagates_errors(self) -> None:
+        """Should re-raise errors from the wrapped iterator."""
+
+        async def failing():
+            yield 1
+            raise RuntimeError("boom")
+
+        iterator = prefetched(failing())
+
+        assert await iterator.__anext__() == 1
+        with pytest.raises(RuntimeError, match="boom"):
+            await iterator.__anext__()
+
+
+class TestPaginatorMaxItems:
+    """Tests for Paginator(max_items=...)"""
+
+    async def test_stops_at_max_items(self) -> None:
+        """Should stop after max_items without fetching another page."""
+        paginator, cursors = make_paginator([
+            {"data": MOCK_USERS[:1], "has_more": True, "next_cursor": "c1"},
+            {"data": MOCK_USERS[1:], "has_more": False},
+        ], max_items=1)
+
+        users = [user async for user in prefetched(paginator)]
+
+        assert [u.id for u in users] == [MOCK_USERS[0]["id"]]
+        assert cursors == [None]
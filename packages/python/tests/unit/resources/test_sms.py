@@ -0,0 +1,173 @@
+"""Unit tests for SMS bulk and buffered sending.
+
+The SMS provider calls are still mocked inside ``SMS._send_to``, so these
+tests replace that method rather than intercepting HTTP with respx.
+"""
+import asyncio
+from typing import Any
+
+import pytest
+
+from luna.resources.messaging import (
+    SMS,
+    SMSBulkSendRequest,
+    SMSConfig,
+    SMSMessage,
+    SMSSendRequest,
+)
+from luna.resources.messaging.sms import _SMSBatcher
+
+
+def make_sms(**config: Any) -> SMS:
+    """Create an SMS resource without an HTTP client."""
+    return SMS(None, SMSConfig(provider="clickatell", api_key="key", **config))  # type: ignore[arg-type]
+
+
+class InFlightCounter:
+    """Stand-in for ``SMS._send_to`` recording peak concurrency."""
+
+    def __init__(self, sms: SMS, fail_for: frozenset[str] = frozenset()) -> None:
+        self._send_to = sms._send_to
+        self._fail_for = fail_for
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(self, to: str, request: SMSBulkSendRequest) -> SMSMessage:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if to in self._fail_for:
+                raise RuntimeError(f"rejected {to}")
+            return await self._send_to(to, request)
+        finally:
+            self.in_flight -= 1
+
+
+def bulk_request(count: int) -> SMSBulkSendRequest:
+    return SMSBulkSendRequest(
+        to=[f"+2782000{i:04d}" for i in range(count)], body="Hello"
+    )
+
+
+class TestSendBulk:
+    """Tests for SMS.send_bulk() concurrency"""
+
+    async def test_caps_in_flight_at_max_concurrency(self) -> None:
+        """Should never have more than max_concurrency sends in flight."""
+        sms = make_sms(max_concurrency=3, batch_size=100)
+        counter = InFlightCounter(sms)
+        sms._send_to = counter  # type: ignore[method-assign]
+
+        result = await sms.send_bulk(bulk_request(10))
+
+        assert len(result.successful) == 10
+        assert counter.peak == 3
+
+    async def test_caps_in_flight_at_batch_size(self) -> None:
+        """Should wait for each batch before starting the next."""
+        sms = make_sms(max_concurrency=10, batch_size=4)
+        counter = InFlightCounter(sms)
+        sms._send_to = counter  # type: ignore[method-assign]
+
+        result = await sms.send_bulk(bulk_request(10))
+
+        assert len(result.successful) == 10
+        assert counter.peak == 4
+
+    async def test_reports_failures_per_recipient(self) -> None:
+        """Should keep sending after one recipient fails."""
+        sms = make_sms(batch_size=2)
+        request = bulk_request(3)
+        sms._send_to = InFlightCounter(  # type: ignore[method-assign]
+            sms, fail_for=frozenset({request.to[1]})
+        )
+
+        result = await sms.send_bulk(request)
+
+        assert [m.to for m in result.successful] == [request.to[0], request.to[2]]
+        assert len(result.failed) == 1
+        assert result.failed[0].to == request.to[1]
+        assert "rejected" in result.failed[0].error
+
+
+class RecordingFlush:
+    """Stand-in flush callable recording the batches it receives."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.batches: list[list[SMSSendRequest]] = []
+        self._error = error
+
+    async def __call__(
+        self, requests: list[SMSSendRequest]
+    ) -> list[SMSMessage | Exception]:
+        self.batches.append(requests)
+        if self._error is not None:
+            raise self._error
+        return [
+            SMSMessage(
+                id=f"sms_{i}",
+                to=str(r.to),
+                body=r.body,
+                status="pending",
+                direction="outbound",
+                provider="clickatell",
+                created_at="",
+                updated_at="",
+            )
+            for i, r in enumerate(requests)
+        ]
+
+
+def send_request(i: int) -> SMSSendRequest:
+    return SMSSendRequest(to=f"+2782000{i:04d}", body=f"Message {i}")
+
+
+class TestSMSBatcher:
+    """Tests for buffered SMS batching"""
+
+    async def test_flushes_when_batch_is_full(self) -> None:
+        """Should flush as soon as max_size messages are queued."""
+        flush = RecordingFlush()
+        batcher = _SMSBatcher(flush, max_size=3, window=60)
+
+        futures = [batcher.submit(send_request(i)) for i in range(3)]
+        messages = await asyncio.wait_for(asyncio.gather(*futures), 1)
+
+        assert len(flush.batches) == 1
+        assert [m.body for m in messages] == ["Message 0", "Message 1", "Message 2"]
+
+    async def test_flushes_when_window_elapses(self) -> None:
+        """Should flush a partial batch once the window has passed."""
+        flush = RecordingFlush()
+        batcher = _SMSBatcher(flush, max_size=10, window=0.05)
+
+        futures = [batcher.submit(send_request(i)) for i in range(2)]
+        await asyncio.sleep(0.01)
+        assert flush.batches == []
+
+        messages = await asyncio.wait_for(asyncio.gather(*futures), 1)
+
+        assert len(flush.batches) == 1
+        assert len(messages) == 2
+
+    async def test_aclose_drains_pending_messages(self) -> None:
+        """Should send queued messages on aclose() without waiting for the window."""
+        sms = make_sms(buffer_size=10, buffer_window=60)
+
+        futures = [sms.send_buffered(send_request(i)) for i in range(2)]
+        await asyncio.wait_for(sms.aclose(), 1)
+
+        assert all(f.done() for f in futures)
+        assert [f.result().body for f in futures] == ["Message 0", "Message 1"]
+
+    async def test_flush_error_fails_every_future(self) -> None:
+        """Should propagate a flush exception to each message in the batch."""
+        flush = RecordingFlush(error=RuntimeError("provider down"))
+        batcher = _SMSBatcher(flush, max_size=2, window=60)
+
+        futures = [batcher.submit(send_request(i)) for i in range(2)]
+
+        for future in futures:
+            with pytest.raises(RuntimeError, match="provider down"):
+                await asyncio.wait_for(future, 1)
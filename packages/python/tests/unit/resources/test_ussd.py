@@ -0,0 +1,52 @@
+"""Unit tests for USSD handler dispatch."""
+from luna.resources.messaging import USSD, USSDConfig, USSDResponse, USSDSession
+
+
+def make_ussd() -> USSD:
+    """Create a USSD service without an HTTP client."""
+    config = USSDConfig(provider="africastalking", api_key="key", service_code="*120#")
+    return USSD(None, config)  # type: ignore[arg-type]
+
+
+def make_session(text: str = "") -> USSDSession:
+    return USSDSession(
+        id="1", session_id="1", phone_number="+27820000000", service_code="*120#", text=text
+    )
+
+
+class TestUSSDDispatch:
+    """Tests for USSD.process_request()"""
+
+    async def test_sync_handler(self) -> None:
+        """Should return the response of a plain function handler."""
+        ussd = make_ussd()
+        ussd.on_session(lambda session: USSDResponse(text="sync", end=True))
+
+        response = await ussd.process_request(make_session())
+
+        assert response.text == "sync"
+
+    async def test_async_handler(self) -> None:
+        """Should await a coroutine function handler."""
+        async def handler(session: USSDSession) -> USSDResponse:
+            return USSDResponse(text=f"async {session.text}", end=True)
+
+        ussd = make_ussd()
+        ussd.on_menu("1", handler)
+
+        response = await ussd.process_request(make_session("1*2"))
+
+        assert response.text == "async 1*2"
+
+    async def test_handler_error(self) -> None:
+        """Should answer with an error response when the handler raises."""
+        def handler(session: USSDSession) -> USSDResponse:
+            raise RuntimeError("boom")
+
+        ussd = make_ussd()
+        ussd.on_session(handler)
+
+        response = await ussd.process_request(make_session())
+
+        assert response.end is True
+        assert "error" in response.text
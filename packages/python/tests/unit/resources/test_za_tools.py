@@ -0,0 +1,104 @@
+"""Unit tests for ZA tools lookup caching."""
+import asyncio
+import copy
+from unittest.mock import AsyncMock, MagicMock
+
+from luna.resources.za_tools import BBBEE, CIPC, BBBEEConfig, CIPCConfig
+
+MOCK_COMPANY = {
+    "registration_number": "2020/123456/07",
+    "name": "Example (Pty) Ltd",
+    "type": "PTY_LTD",
+    "status": "active",
+    "directors": [],
+}
+
+MOCK_CERTIFICATE = {
+    "certificate_number": "BEE-001",
+    "company_name": "Example (Pty) Ltd",
+    "registration_number": "2020/123456/07",
+    "level": 2,
+    "verification_agency": "Agency",
+    "issue_date": "2024-01-01",
+    "expiry_date": "2999-01-01",
+}
+
+
+def mock_http_client(payload: dict) -> AsyncMock:
+    """Create an HTTP client stub answering every request with ``payload``."""
+    client = AsyncMock()
+    client.request.side_effect = lambda **_: MagicMock(data=copy.deepcopy(payload))
+    return client
+
+
+class TestCIPCCache:
+    """Tests for CIPC.lookup() caching"""
+
+    async def test_cache_hit_skips_request(self) -> None:
+        """Should answer a repeat lookup from the cache."""
+        http = mock_http_client(MOCK_COMPANY)
+        cipc = CIPC(http, CIPCConfig(cache_ttl=60))
+
+        first = await cipc.lookup("2020/123456/07")
+        second = await cipc.lookup("2020 123456 07")
+
+        assert http.request.await_count == 1
+        assert first == second
+
+    async def test_cached_result_is_a_copy(self) -> None:
+        """Should not let a caller's mutation leak into later lookups."""
+        cipc = CIPC(mock_http_client(MOCK_COMPANY), CIPCConfig(cache_ttl=60))
+
+        first = await cipc.lookup("2020/123456/07")
+        assert first is not None
+        first.directors.append("mutated")  # type: ignore[arg-type]
+        second = await cipc.lookup("2020/123456/07")
+
+        assert second is not None
+        assert second.directors == []
+
+    async def test_cache_entry_expires(self) -> None:
+        """Should fetch again once the TTL has passed."""
+        http = mock_http_client(MOCK_COMPANY)
+        cipc = CIPC(http, CIPCConfig(cache_ttl=0.05))
+
+        await cipc.lookup("2020/123456/07")
+        await asyncio.sleep(0.1)
+        await cipc.lookup("2020/123456/07")
+
+        assert http.request.await_count == 2
+
+    async def test_disabled_by_default(self) -> None:
+        """Should not cache when cache_ttl is 0, the default."""
+        http = mock_http_client(MOCK_COMPANY)
+        cipc = CIPC(http, CIPCConfig())
+
+        await cipc.lookup("2020/123456/07")
+        await cipc.lookup("2020/123456/07")
+
+        assert http.request.await_count == 2
+
+
+class TestBBBEECache:
+    """Tests for BBBEE.lookup_by_company() caching"""
+
+    async def test_cache_keyed_by_cleaned_registration_number(self) -> None:
+        """Should treat formatting variants of one number as the same key."""
+        http = mock_http_client(MOCK_CERTIFICATE)
+        bbbee = BBBEE(http, BBBEEConfig(cache_ttl=60))
+
+        await bbbee.lookup_by_company("2020/123456/07")
+        result = await bbbee.meets_requirement("202012345607", 3)
+
+        assert http.request.await_count == 1
+        assert result["meets"] is True
+
+    async def test_disabled_with_zero_ttl(self) -> None:
+        """Should fetch every time when cache_ttl is 0."""
+        http = mock_http_client(MOCK_CERTIFICATE)
+        bbbee = BBBEE(http, BBBEEConfig(cache_ttl=0))
+
+        await bbbee.lookup_by_company("2020/123456/07")
+        await bbbee.lookup_by_company("2020/123456/07")
+
+        assert http.request.await_count == 2
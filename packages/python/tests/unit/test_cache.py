@@ -0,0 +1,44 @@
+"""Unit tests for the in-process TTL cache."""
+import time
+
+import pytest
+
+from luna.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache"""
+
+    def test_returns_stored_value(self) -> None:
+        """Should return a value until it expires."""
+        cache: TTLCache[str, int] = TTLCache(ttl=60.0)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_expires_entries(self) -> None:
+        """Should drop entries older than the ttl."""
+        cache: TTLCache[str, int] = TTLCache(ttl=0.01)
+        cache.set("a", 1)
+
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_evicts_oldest_when_full(self) -> None:
+        """Should evict the oldest entry once maxsize is exceeded."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60.0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_rejects_non_positive_ttl(self) -> None:
+        """Should reject a ttl of zero."""
+        with pytest.raises(ValueError):
+            TTLCache(ttl=0)
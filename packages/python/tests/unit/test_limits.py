@@ -0,0 +1,36 @@
+"""Unit tests for client-side rate limiting."""
+import time
+
+import pytest
+
+from luna.http.limits import RateLimiter
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter"""
+
+    async def test_allows_initial_burst(self) -> None:
+        """Should not delay requests within the bucket capacity."""
+        limiter = RateLimiter(rate=5, per=60.0)
+
+        start = time.monotonic()
+        for _ in range(5):
+            await limiter.acquire()
+
+        assert time.monotonic() - start < 0.1
+
+    async def test_waits_when_bucket_empty(self) -> None:
+        """Should delay requests once the bucket is exhausted."""
+        limiter = RateLimiter(rate=2, per=0.1)
+        await limiter.acquire()
+        await limiter.acquire()
+
+        start = time.monotonic()
+        await limiter.acquire()
+
+        assert time.monotonic() - start >= 0.03
+
+    def test_rejects_non_positive_rate(self) -> None:
+        """Should reject a rate of zero."""
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)